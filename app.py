@@ -11,19 +11,17 @@ import logging
 import os
 
 # Configure logging
-from config.settings import LOGGING_CONFIG, PAGE_CONFIG
+from config.settings import LOGGING_CONFIG, PAGE_CONFIG, get_logging_handlers
 
-logging.basicConfig(
-    level=LOGGING_CONFIG["level"],
-    format=LOGGING_CONFIG["format"],
-    handlers=LOGGING_CONFIG["handlers"]
-)
+# Streamlit re-executes this script on every rerun; only build handlers the first time
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=LOGGING_CONFIG["level"],
+        format=LOGGING_CONFIG["format"],
+        handlers=get_logging_handlers()
+    )
 logger = logging.getLogger(__name__)
 
-# Import page modules
-from ui.pages.analysis import display_page as display_analysis_page
-from ui.pages.gear_comparison import display_page as display_gear_comparison_page
-
 def main():
     """Main application entry point"""
     # Set page configuration
@@ -122,9 +120,13 @@ def main():
         st.session_state.page = "About"
     
     # Display content based on the selected page
+    # Page modules are imported on demand so the About page does not pull in
+    # the analysis stack (matplotlib, folium, ...)
     if st.session_state.page == "Track Analysis":
+        from ui.pages.analysis import display_page as display_analysis_page
         display_analysis_page()
     elif st.session_state.page == "Gear Comparison":
+        from ui.pages.gear_comparison import display_page as display_gear_comparison_page
         display_gear_comparison_page()
     else:
         # About page with instructions and features
@@ -157,50 +159,32 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Step 1
-        col1, col2 = st.columns([1, 8])
-        with col1:
-            st.markdown('<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">1</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<strong style="font-size: 1.1rem;">Export Your GPS Track</strong>', unsafe_allow_html=True)
-            st.write("Download your activity as a GPX file from Strava or your GPS device.")
-            st.caption("In Strava: Open an activity → Click the \"...\" button → Select \"Export GPX\"")
-        
-        # Step 2
-        col1, col2 = st.columns([1, 8])
-        with col1:
-            st.markdown('<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">2</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<strong style="font-size: 1.1rem;">Upload to Foil Lab</strong>', unsafe_allow_html=True)
-            st.write("Go to the Track Analysis tab and upload your GPX file.")
-            st.caption("Enter your best estimate of the wind direction during your session.")
-        
-        # Step 3
-        col1, col2 = st.columns([1, 8])
-        with col1:
-            st.markdown('<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">3</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<strong style="font-size: 1.1rem;">Analyze Your Performance</strong>', unsafe_allow_html=True)
-            st.write("Review your tracks, sailing angles, and performance data.")
-            st.caption("The polar plot shows your speed at different angles to the wind.")
-        
-        # Step 4
-        col1, col2 = st.columns([1, 8])
-        with col1:
-            st.markdown('<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">4</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<strong style="font-size: 1.1rem;">Fine-tune Wind Direction</strong>', unsafe_allow_html=True)
-            st.write("Adjust the wind direction if needed to match your actual session conditions.")
-            st.caption("The app will calculate a session average wind direction based on your sailing patterns.")
+        steps = [
+            ("Export Your GPS Track",
+             "Download your activity as a GPX file from Strava or your GPS device.",
+             "In Strava: Open an activity → Click the \"...\" button → Select \"Export GPX\""),
+            ("Upload to Foil Lab",
+             "Go to the Track Analysis tab and upload your GPX file.",
+             "Enter your best estimate of the wind direction during your session."),
+            ("Analyze Your Performance",
+             "Review your tracks, sailing angles, and performance data.",
+             "The polar plot shows your speed at different angles to the wind."),
+            ("Fine-tune Wind Direction",
+             "Adjust the wind direction if needed to match your actual session conditions.",
+             "The app will calculate a session average wind direction based on your sailing patterns."),
+            ("Compare Different Gear Setups",
+             "Export your analyzed tracks to the Gear Comparison page.",
+             "Compare multiple tracks to see how different equipment performs in various conditions.")
+        ]
         
-        # Step 5 - New step for gear comparison
-        col1, col2 = st.columns([1, 8])
-        with col1:
-            st.markdown('<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">5</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<strong style="font-size: 1.1rem;">Compare Different Gear Setups</strong>', unsafe_allow_html=True)
-            st.write("Export your analyzed tracks to the Gear Comparison page.")
-            st.caption("Compare multiple tracks to see how different equipment performs in various conditions.")
+        for number, (title, description, hint) in enumerate(steps, start=1):
+            col1, col2 = st.columns([1, 8])
+            with col1:
+                st.markdown(f'<div style="background-color: #0068C9; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; font-weight: bold;">{number}</div>', unsafe_allow_html=True)
+            with col2:
+                st.markdown(f'<strong style="font-size: 1.1rem;">{title}</strong>', unsafe_allow_html=True)
+                st.write(description)
+                st.caption(hint)
         
         # Current Features
         st.markdown("<h3>Current Features</h3>", unsafe_allow_html=True)
@@ -5,20 +5,21 @@ This module centralizes all configuration values and constants used throughout t
 making it easier to maintain and modify application behavior.
 """
 
-import os
 import logging
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, List
 
 # App information
 APP_NAME = "WingWizard"
 APP_VERSION = "1.0.0"
 APP_DESCRIPTION = "Analyze wingfoil tracks to improve performance"
 
-# File paths
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LOGS_DIR = os.path.join(BASE_DIR, "logs")
-PLOTS_DIR = os.path.join(BASE_DIR, "plots")
+# File paths (resolved once; exposed as strings for os.path callers)
+_BASE_PATH = Path(__file__).resolve().parent.parent
+BASE_DIR = str(_BASE_PATH)
+DATA_DIR = str(_BASE_PATH / "data")
+LOGS_DIR = str(_BASE_PATH / "logs")
+PLOTS_DIR = str(_BASE_PATH / "plots")
 
 # Wind direction settings
 DEFAULT_WIND_DIRECTION = 90  # Degrees (East)
@@ -67,15 +68,27 @@ EXPORT_VERSION = "1.0"  # Version of export file format
 # Gear comparison parameters
 DEFAULT_MAX_GEAR_ITEMS = 10  # Maximum number of gear items to compare at once
 
-# Logging configuration
+# Logging configuration (handlers are created by get_logging_handlers when logging is set up)
 LOGGING_CONFIG = {
     "level": logging.INFO,
     "format": '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    "handlers": [
+    "log_file": str(_BASE_PATH / 'app.log')
+}
+
+def get_logging_handlers() -> List[logging.Handler]:
+    """
+    Create the handlers described by LOGGING_CONFIG.
+    
+    Importing this module no longer opens the log file; the file handler is
+    created here and only opens the file when the first record is written.
+    
+    Returns:
+        list: Console and file handlers
+    """
+    return [
         logging.StreamHandler(),
-        logging.FileHandler(os.path.join(BASE_DIR, 'app.log'))
+        logging.FileHandler(LOGGING_CONFIG["log_file"], delay=True)
     ]
-}
 
 # Streamlit page configuration
 PAGE_CONFIG = {
@@ -102,18 +115,21 @@ class SegmentConfig:
     MIN_SEGMENT_DISTANCE = DEFAULT_MIN_SEGMENT_DISTANCE
     MIN_POINTS = DEFAULT_MIN_POINTS_FOR_SEGMENT
     
+    # Built once from the constants above; as_dict hands out copies
+    _DICT = {
+        'angle_tolerance': ANGLE_TOLERANCE,
+        'min_duration': MIN_DURATION,
+        'min_distance': MIN_DISTANCE,
+        'min_speed': MIN_SPEED,
+        'suspicious_angle_threshold': SUSPICIOUS_ANGLE_THRESHOLD,
+        'min_segment_distance': MIN_SEGMENT_DISTANCE,
+        'min_points': MIN_POINTS,
+    }
+    
     @classmethod
     def as_dict(cls) -> Dict[str, Any]:
         """Get segment configuration as a dictionary."""
-        return {
-            'angle_tolerance': cls.ANGLE_TOLERANCE,
-            'min_duration': cls.MIN_DURATION,
-            'min_distance': cls.MIN_DISTANCE,
-            'min_speed': cls.MIN_SPEED,
-            'suspicious_angle_threshold': cls.SUSPICIOUS_ANGLE_THRESHOLD,
-            'min_segment_distance': cls.MIN_SEGMENT_DISTANCE,
-            'min_points': cls.MIN_POINTS,
-        }
+        return dict(cls._DICT)
 
 
 class WindConfig:
@@ -124,16 +140,19 @@ class WindConfig:
     CONVERGENCE_THRESHOLD = DEFAULT_CONVERGENCE_THRESHOLD
     VMG_ANGLE_RANGE = DEFAULT_VMG_ANGLE_RANGE
     
+    # Built once from the constants above; as_dict hands out copies
+    _DICT = {
+        'default_direction': DEFAULT_DIRECTION,
+        'estimation_method': ESTIMATION_METHOD,
+        'max_iterations': MAX_ITERATIONS,
+        'convergence_threshold': CONVERGENCE_THRESHOLD,
+        'vmg_angle_range': VMG_ANGLE_RANGE,
+    }
+    
     @classmethod
     def as_dict(cls) -> Dict[str, Any]:
         """Get wind configuration as a dictionary."""
-        return {
-            'default_direction': cls.DEFAULT_DIRECTION,
-            'estimation_method': cls.ESTIMATION_METHOD,
-            'max_iterations': cls.MAX_ITERATIONS,
-            'convergence_threshold': cls.CONVERGENCE_THRESHOLD,
-            'vmg_angle_range': cls.VMG_ANGLE_RANGE,
-        }
+        return dict(cls._DICT)
 
 
 class UIConfig:
@@ -147,16 +166,19 @@ class UIConfig:
     TRACK_LINE_WIDTH = DEFAULT_TRACK_LINE_WIDTH
     SEGMENT_LINE_WIDTH = DEFAULT_SEGMENT_LINE_WIDTH
     
+    # Built once from the constants above; as_dict hands out copies
+    _DICT = {
+        'port_color': PORT_COLOR,
+        'starboard_color': STARBOARD_COLOR,
+        'suspicious_color': SUSPICIOUS_COLOR,
+        'upwind_alpha': UPWIND_ALPHA,
+        'downwind_alpha': DOWNWIND_ALPHA,
+        'map_zoom': MAP_ZOOM,
+        'track_line_width': TRACK_LINE_WIDTH,
+        'segment_line_width': SEGMENT_LINE_WIDTH,
+    }
+    
     @classmethod
     def as_dict(cls) -> Dict[str, Any]:
         """Get UI configuration as a dictionary."""
-        return {
-            'port_color': cls.PORT_COLOR,
-            'starboard_color': cls.STARBOARD_COLOR,
-            'suspicious_color': cls.SUSPICIOUS_COLOR,
-            'upwind_alpha': cls.UPWIND_ALPHA,
-            'downwind_alpha': cls.DOWNWIND_ALPHA,
-            'map_zoom': cls.MAP_ZOOM,
-            'track_line_width': cls.TRACK_LINE_WIDTH,
-            'segment_line_width': cls.SEGMENT_LINE_WIDTH,
-        }
\ No newline at end of file
+        return dict(cls._DICT)
\ No newline at end of file
@@ -5,12 +5,27 @@ This module contains functions for calculating various metrics from track data,
 such as distance, speed, and duration.
 """
 
+import logging
 from datetime import timedelta
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Union
-from geopy.distance import geodesic
-from utils.geo import meters_per_second_to_knots, knots_to_meters_per_second
+from typing import Dict, Any, List, Optional, Tuple, Union
+from utils.geo import calculate_distances, meters_per_second_to_knots
+
+logger = logging.getLogger(__name__)
+
+# Speed metrics when no hop is fast enough (or timed) to count
+_ZERO_SPEEDS = MappingProxyType({
+    'avg_speed': 0,
+    'weighted_avg_speed': 0,
+    'overall_avg_speed': 0,
+    'active_duration': timedelta(0),
+    'active_distance': 0,
+})
+
+# Distance and speed metrics for tracks with fewer than two points
+_EMPTY_METRICS = MappingProxyType({'distance': 0, **_ZERO_SPEEDS})
 
 def calculate_track_metrics(gpx_data: pd.DataFrame, min_speed_knots: float = 0.0) -> Dict[str, Any]:
     """
@@ -37,7 +52,15 @@ def calculate_track_metrics(gpx_data: pd.DataFrame, min_speed_knots: float = 0.0
     """
     metrics = {}
     
-    if 'time' in gpx_data.columns and gpx_data['time'].notna().any():
+    # Convert timestamps once; NaT marks a fix without a time
+    if 'time' in gpx_data.columns:
+        times = pd.to_datetime(gpx_data['time']).to_numpy(dtype='datetime64[ns]')
+        has_time = ~np.isnat(times)
+    else:
+        times = None
+        has_time = np.zeros(len(gpx_data), dtype=bool)
+    
+    if has_time.any():
         start_time = gpx_data['time'].min()
         end_time = gpx_data['time'].max()
         duration = end_time - start_time
@@ -51,89 +74,91 @@ def calculate_track_metrics(gpx_data: pd.DataFrame, min_speed_knots: float = 0.0
         metrics['duration'] = timedelta(0)
         metrics['total_duration_seconds'] = 0
     
-    # Calculate total distance and speed for each segment
-    if len(gpx_data) > 1:
-        distances = []
-        speeds_m_per_s = []
-        segment_durations = []
-        
-        for i in range(len(gpx_data) - 1):
-            point1 = (gpx_data.iloc[i]['latitude'], gpx_data.iloc[i]['longitude'])
-            point2 = (gpx_data.iloc[i+1]['latitude'], gpx_data.iloc[i+1]['longitude'])
-            
-            # Calculate distance for this segment
-            segment_distance_km = geodesic(point1, point2).kilometers
-            segment_distance_m = segment_distance_km * 1000
-            distances.append(segment_distance_m)
-            
-            # Calculate duration and speed if time data available
-            if 'time' in gpx_data.columns and gpx_data.iloc[i]['time'] is not None and gpx_data.iloc[i+1]['time'] is not None:
-                segment_duration = (gpx_data.iloc[i+1]['time'] - gpx_data.iloc[i]['time']).total_seconds()
-                segment_durations.append(segment_duration)
-                
-                # Calculate speed in m/s
-                if segment_duration > 0:
-                    speed_m_per_s = segment_distance_m / segment_duration
-                    speeds_m_per_s.append(speed_m_per_s)
-        
-        # Total distance in kilometers
-        total_distance_km = sum(distances) / 1000
-        metrics['distance'] = total_distance_km
+    # Not enough points for distance or speed
+    if len(gpx_data) < 2:
+        metrics.update(_EMPTY_METRICS)
+        return metrics
+    
+    lats = gpx_data['latitude'].to_numpy(dtype=np.float64)
+    lons = gpx_data['longitude'].to_numpy(dtype=np.float64)
+    
+    # Distance between consecutive points, in one vectorized pass
+    distances = calculate_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    
+    # Duration of each hop in seconds (NaN where a timestamp is missing)
+    if times is not None:
+        segment_durations = np.diff(times).view(np.int64) * 1e-9
+        # Complete tracks, the usual case, need no masking
+        if not has_time.all():
+            segment_durations[~(has_time[:-1] & has_time[1:])] = np.nan
+    else:
+        segment_durations = np.full(len(distances), np.nan)
+    
+    # Speed is only defined for hops that take time (NaN compares as False)
+    moving = segment_durations > 0
+    
+    # Total distance in kilometers
+    total_distance_km = float(distances.sum()) / 1000
+    metrics['distance'] = total_distance_km
+    
+    # Calculate average speed excluding segments below threshold
+    if moving.any():
+        active_distance_m, active_time_s, speed_sum_ms, active_count = _active_totals(
+            distances[moving], segment_durations[moving], min_speed_knots
+        )
         
-        # Calculate average speed excluding segments below threshold
-        if speeds_m_per_s:
-            # Convert speeds to knots for comparison with threshold
-            speeds_knots = [meters_per_second_to_knots(s) for s in speeds_m_per_s]
+        if active_count:
+            # Calculate metrics
+            metrics['active_duration'] = timedelta(seconds=active_time_s)
+            metrics['active_distance'] = active_distance_m / 1000  # in km
             
-            # Filter by minimum speed
-            min_speed_ms = knots_to_meters_per_second(min_speed_knots)
-            active_speeds_ms = [s for s, knots in zip(speeds_m_per_s, speeds_knots) if knots >= min_speed_knots]
-            active_durations = [d for d, knots in zip(segment_durations, speeds_knots) if knots >= min_speed_knots]
+            # Calculate average speed from segments above threshold
+            metrics['avg_speed'] = meters_per_second_to_knots(speed_sum_ms / active_count)
             
-            if active_speeds_ms:
-                # Calculate distance covered at speeds above threshold
-                active_distance_m = sum(s * d for s, d in zip(active_speeds_ms, active_durations))
-                active_time_s = sum(active_durations)
-                
-                # Calculate metrics
-                metrics['active_duration'] = timedelta(seconds=active_time_s)
-                metrics['active_distance'] = active_distance_m / 1000  # in km
-                
-                # Calculate average speed from segments above threshold
-                avg_speed_ms = sum(active_speeds_ms) / len(active_speeds_ms)
-                metrics['avg_speed'] = meters_per_second_to_knots(avg_speed_ms)
-                
-                # Calculate weighted average speed (by duration)
-                if active_time_s > 0:
-                    weighted_avg_ms = active_distance_m / active_time_s
-                    metrics['weighted_avg_speed'] = meters_per_second_to_knots(weighted_avg_ms)
-                else:
-                    metrics['weighted_avg_speed'] = 0
-                
-                # Calculate "traditional" avg speed over whole track for comparison
-                m_per_s = total_distance_km * 1000 / metrics['total_duration_seconds'] if metrics['total_duration_seconds'] > 0 else 0
-                metrics['overall_avg_speed'] = meters_per_second_to_knots(m_per_s)
+            # Calculate weighted average speed (by duration)
+            if active_time_s > 0:
+                weighted_avg_ms = active_distance_m / active_time_s
+                metrics['weighted_avg_speed'] = meters_per_second_to_knots(weighted_avg_ms)
             else:
-                # If there are no segments above the threshold
-                metrics['active_duration'] = timedelta(seconds=0)
-                metrics['active_distance'] = 0
-                metrics['avg_speed'] = 0
                 metrics['weighted_avg_speed'] = 0
-                metrics['overall_avg_speed'] = 0
-        else:
-            # No speed data available
-            metrics['avg_speed'] = 0
-            metrics['weighted_avg_speed'] = 0
-            metrics['overall_avg_speed'] = 0
-    else:
-        # Not enough points for calculation
-        metrics['distance'] = 0
-        metrics['avg_speed'] = 0
-        metrics['weighted_avg_speed'] = 0
-        metrics['overall_avg_speed'] = 0
+            
+            # Calculate "traditional" avg speed over whole track for comparison
+            m_per_s = total_distance_km * 1000 / metrics['total_duration_seconds'] if metrics['total_duration_seconds'] > 0 else 0
+            metrics['overall_avg_speed'] = meters_per_second_to_knots(m_per_s)
+            return metrics
     
+    # No timed hops, or none above the threshold
+    metrics.update(_ZERO_SPEEDS)
     return metrics
 
+def _active_totals(
+    distances: np.ndarray,
+    durations: np.ndarray,
+    min_speed_knots: float
+) -> Tuple[float, float, float, int]:
+    """
+    Reduce per-hop distances and durations to totals over the active hops.
+    
+    Each total is a dot product with the active mask, so the selected hops
+    are never copied out into separate arrays.
+    
+    Args:
+        distances: Distance of each hop in meters
+        durations: Duration of each hop in seconds (all positive)
+        min_speed_knots: Minimum speed (in knots) for a hop to count as active
+        
+    Returns:
+        tuple: (active_distance_m, active_time_s, speed_sum_ms, active_count)
+    """
+    speeds_m_per_s = distances / durations
+    active = (meters_per_second_to_knots(speeds_m_per_s) >= min_speed_knots).astype(float)
+    return (
+        float(distances @ active),
+        float(durations @ active),
+        float(speeds_m_per_s @ active),
+        int(active.sum()),
+    )
+
 def calculate_average_angle_from_segments(segments: pd.DataFrame) -> Dict[str, Any]:
     """
     Calculate the average angle to wind based on selected segments.
@@ -165,13 +190,15 @@ def calculate_average_angle_from_segments(segments: pd.DataFrame) -> Dict[str, A
             'starboard_count': 0
         }
     
-    import numpy as np
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Split by tack
-    port_tack = segments[segments['tack'] == 'Port']
-    starboard_tack = segments[segments['tack'] == 'Starboard']
+    # Pull the columns out once and split by tack with boolean masks
+    tacks = segments['tack'].to_numpy()
+    distances = segments['distance'].to_numpy()
+    angles = segments['angle_to_wind'].to_numpy()
+    bearings = segments['bearing'].to_numpy()
+    port_mask = tacks == 'Port'
+    starboard_mask = tacks == 'Starboard'
+    port_count = int(port_mask.sum())
+    starboard_count = int(starboard_mask.sum())
     
     # Get averages for each tack (weighted by distance)
     port_average = None
@@ -180,37 +207,27 @@ def calculate_average_angle_from_segments(segments: pd.DataFrame) -> Dict[str, A
     port_bearings = []
     starboard_bearings = []
     
-    if not port_tack.empty:
-        # Weight by distance
-        port_weights = port_tack['distance'].values
-        port_angles = port_tack['angle_to_wind'].values
-        port_bearings = port_tack['bearing'].values.tolist()
-        
-        # Calculate weighted average
-        port_average = np.average(port_angles, weights=port_weights)
-        logger.info(f"Port tack average angle: {port_average:.1f}° (from {len(port_tack)} segments)")
-    
-    if not starboard_tack.empty:
-        # Weight by distance
-        starboard_weights = starboard_tack['distance'].values
-        starboard_angles = starboard_tack['angle_to_wind'].values
-        starboard_bearings = starboard_tack['bearing'].values.tolist()
-        
-        # Calculate weighted average
-        starboard_average = np.average(starboard_angles, weights=starboard_weights)
-        logger.info(f"Starboard tack average angle: {starboard_average:.1f}° (from {len(starboard_tack)} segments)")
+    if port_count:
+        port_bearings = bearings[port_mask].tolist()
+        port_average = np.average(angles[port_mask], weights=distances[port_mask])
+        logger.info("Port tack average angle: %.1f° (from %d segments)", port_average, port_count)
+    
+    if starboard_count:
+        starboard_bearings = bearings[starboard_mask].tolist()
+        starboard_average = np.average(angles[starboard_mask], weights=distances[starboard_mask])
+        logger.info("Starboard tack average angle: %.1f° (from %d segments)", starboard_average, starboard_count)
     
     # If we have data from both tacks, average them
     if port_average is not None and starboard_average is not None:
         avg_angle = (port_average + starboard_average) / 2
-        logger.info(f"Combined average angle off the wind: {avg_angle:.1f}° " +
-                   f"(port: {port_average:.1f}°, starboard: {starboard_average:.1f}°)")
+        logger.info("Combined average angle off the wind: %.1f° (port: %.1f°, starboard: %.1f°)",
+                    avg_angle, port_average, starboard_average)
     elif port_average is not None:
         avg_angle = port_average
-        logger.info(f"Using only port tack data for average angle: {avg_angle:.1f}°")
+        logger.info("Using only port tack data for average angle: %.1f°", avg_angle)
     elif starboard_average is not None:
         avg_angle = starboard_average
-        logger.info(f"Using only starboard tack data for average angle: {avg_angle:.1f}°")
+        logger.info("Using only starboard tack data for average angle: %.1f°", avg_angle)
     
     # Combine all bearings used
     selected_bearings = port_bearings + starboard_bearings
@@ -220,6 +237,6 @@ def calculate_average_angle_from_segments(segments: pd.DataFrame) -> Dict[str, A
         'port_average': port_average,
         'starboard_average': starboard_average,
         'selected_bearings': selected_bearings,
-        'port_count': len(port_tack),
-        'starboard_count': len(starboard_tack)
+        'port_count': port_count,
+        'starboard_count': starboard_count
     }
\ No newline at end of file
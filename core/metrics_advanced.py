@@ -9,14 +9,52 @@ wind direction estimation and VMG calculations.
 from core.wind.models import WindEstimate
 from utils.segment_analysis import detect_suspicious_segments
 
+import dataclasses
 import pandas as pd
 import numpy as np
-import math
 import logging
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Union, Any
 
 logger = logging.getLogger(__name__)
 
+# Columns that make up a segment's quality score and their share of it
+_QUALITY_FACTORS = (('distance', 0.5), ('speed', 0.3), ('duration', 0.2))
+
+# Columns the wind estimate cannot do without
+_WIND_REQUIRED_COLUMNS = ('angle_to_wind', 'tack', 'distance', 'bearing')
+
+def _extract(
+    frame: Optional[pd.DataFrame],
+    columns: Sequence[str],
+    optional: Sequence[str] = ()
+) -> Optional[Dict[str, Optional[np.ndarray]]]:
+    """
+    Validate a segments frame and pull its columns out as float arrays.
+    
+    Callers check the result once and work on the arrays from then on,
+    instead of testing the frame and its columns step by step.
+    
+    Args:
+        frame: Segments DataFrame, or None
+        columns: Columns that must be present
+        optional: Columns extracted when present and set to None otherwise
+        
+    Returns:
+        dict: Array of each column, or None if the frame is missing, empty or
+            lacks a required column
+    """
+    if frame is None or frame.empty:
+        return None
+    
+    present = frame.columns
+    if any(column not in present for column in columns):
+        return None
+    
+    arrays = {column: frame[column].to_numpy(dtype=float) for column in columns}
+    for column in optional:
+        arrays[column] = frame[column].to_numpy(dtype=float) if column in present else None
+    return arrays
+
 def calculate_segment_quality_score(segments: pd.DataFrame) -> pd.Series:
     """
     Calculate a quality score for each segment based on multiple factors.
@@ -34,40 +72,191 @@ def calculate_segment_quality_score(segments: pd.DataFrame) -> pd.Series:
         pd.Series: Quality score for each segment (0-1 range)
     """
     if segments.empty:
-        return pd.Series()
-    
-    # Initialize with base value
-    quality_score = pd.Series(0.5, index=segments.index)
-    
-    # Distance is the primary factor (50%)
-    if 'distance' in segments.columns:
-        max_distance = segments['distance'].max()
-        if max_distance > 0:
-            normalized_distance = segments['distance'] / max_distance
-            # Distance contributes 50% to the score
-            quality_score = 0.5 * normalized_distance
-        else:
-            # If all distances are 0, assign equal weight
-            quality_score = pd.Series(0.5, index=segments.index)
-    
-    # Speed factor (30%) if available
-    if 'speed' in segments.columns:
-        max_speed = segments['speed'].max()
-        if max_speed > 0:
-            normalized_speed = segments['speed'] / max_speed
-            # Speed contributes 30% to quality score
-            quality_score += 0.3 * normalized_speed
-    
-    # Duration factor (20%) if available
-    if 'duration' in segments.columns:
-        max_duration = segments['duration'].max()
-        if max_duration > 0:
-            normalized_duration = segments['duration'] / max_duration
-            # Duration contributes 20% to quality score
-            quality_score += 0.2 * normalized_duration
+        return pd.Series(dtype=float)
+    
+    # The factor columns that are present, as one (n, k) block so their maxima
+    # come from a single reduction rather than a scan per column
+    factors = [(column, share) for column, share in _QUALITY_FACTORS if column in segments.columns]
+    values = segments[[column for column, _ in factors]].to_numpy(dtype=float)
+    
+    # Build the Series once, at the end, around the freshly allocated scores
+    return pd.Series(_quality_scores(values, factors), index=segments.index, copy=False)
+
+def _quality_scores(values: np.ndarray, factors: Sequence[Tuple[str, float]]) -> np.ndarray:
+    """
+    Quality score of each segment from a block of its factor columns.
+    
+    See calculate_segment_quality_score for the weighting.
+    
+    Args:
+        values: (n, k) array with one column per entry of factors
+        factors: (column name, share) of each column in values
+        
+    Returns:
+        np.ndarray: Quality score for each segment (0-1 range)
+    """
+    maxima = values.max(axis=0)
+    
+    # Distance is the primary factor (50%); without usable distances every
+    # segment gets the same 0.5 in its place
+    quality_score = np.full(len(values), 0.5)
+    for (column, share), column_values, column_max in zip(factors, values.T, maxima):
+        if column_max > 0:
+            if column == 'distance':
+                np.multiply(column_values, share / column_max, out=quality_score)
+            else:
+                quality_score += column_values * (share / column_max)
     
     return quality_score
 
+@dataclasses.dataclass
+class SegmentArrays:
+    """
+    Segment columns as NumPy arrays.
+    
+    The VMG calculations unpack their (screened) segments into this once and
+    work on the arrays from there.
+    
+    Columns are kept as float64. A track yields tens to a few hundred segments,
+    so these arrays sit in cache and narrower floats would not speed up the
+    reductions, while casting float64 columns to float32 would add a copy that
+    to_numpy(dtype=float) otherwise avoids.
+    """
+    angle_to_wind: np.ndarray
+    distance: np.ndarray
+    speed: np.ndarray
+    duration: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_frame(cls, segments: pd.DataFrame) -> Optional['SegmentArrays']:
+        """
+        Extract the columns of a segments DataFrame.
+        
+        Args:
+            segments: DataFrame with 'angle_to_wind', 'distance' and 'speed'
+                columns and optionally 'duration'
+            
+        Returns:
+            SegmentArrays: The columns as float arrays, or None if the frame is
+                empty or lacks a required column
+        """
+        arrays = _extract(segments, ('angle_to_wind', 'distance', 'speed'), optional=('duration',))
+        return cls(**arrays) if arrays is not None else None
+    
+    def __len__(self) -> int:
+        return len(self.angle_to_wind)
+    
+    def select(self, mask: np.ndarray) -> 'SegmentArrays':
+        """
+        Segments selected by a boolean mask.
+        
+        Args:
+            mask: Boolean mask over the segments
+            
+        Returns:
+            SegmentArrays: The selected segments
+        """
+        return SegmentArrays(
+            angle_to_wind=self.angle_to_wind[mask],
+            distance=self.distance[mask],
+            speed=self.speed[mask],
+            duration=self.duration[mask] if self.duration is not None else None
+        )
+    
+    def quality_scores(self) -> np.ndarray:
+        """
+        Quality score of each segment, as calculate_segment_quality_score.
+        
+        Returns:
+            np.ndarray: Quality score for each segment (0-1 range)
+        """
+        # _QUALITY_FACTORS lists distance, speed, duration in that order
+        if self.duration is None:
+            return _quality_scores(np.column_stack((self.distance, self.speed)), _QUALITY_FACTORS[:2])
+        return _quality_scores(np.column_stack((self.distance, self.speed, self.duration)), _QUALITY_FACTORS)
+
+def _tack_masks(tacks: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Boolean port and starboard masks for a tack column.
+    
+    Categorical columns (as produced by analyze_wind_angles) are compared on
+    their integer codes, so the labels are never expanded into an object array.
+    
+    Args:
+        tacks: Series of 'Port'/'Starboard' labels, categorical or plain strings
+        
+    Returns:
+        tuple: (port_mask, starboard_mask)
+    """
+    if isinstance(tacks.dtype, pd.CategoricalDtype):
+        codes = tacks.cat.codes.to_numpy()
+        categories = tacks.cat.categories
+        return tuple(
+            codes == categories.get_loc(label) if label in categories
+            else np.zeros(len(codes), dtype=bool)
+            for label in ('Port', 'Starboard')
+        )
+    
+    values = tacks.to_numpy()
+    return values == 'Port', values == 'Starboard'
+
+def _tack_average(
+    angles: np.ndarray,
+    distances: np.ndarray,
+    speeds: Optional[np.ndarray],
+    durations: Optional[np.ndarray],
+    mask: np.ndarray
+) -> Tuple[Optional[float], float, int]:
+    """
+    Quality- and distance-weighted average angle to wind over one tack.
+    
+    Quality scores are normalized within the tack, as if the tack's segments
+    had been passed to calculate_segment_quality_score on their own, and the
+    distance * quality weights are computed directly from the columns.
+    
+    Args:
+        angles: Angle to wind of every upwind segment
+        distances: Distance of every upwind segment
+        speeds: Speed of every upwind segment, or None
+        durations: Duration of every upwind segment, or None
+        mask: Boolean mask selecting the tack's segments
+        
+    Returns:
+        tuple: (weighted average angle or None if the tack is empty,
+            total distance, segment count)
+    """
+    count = int(np.count_nonzero(mask))
+    if count == 0:
+        return None, 0, 0
+    
+    # Combined weights (distance * quality) built straight from the columns: each
+    # term of the quality score is multiplied through by the segment distance,
+    # so no separate quality array is allocated
+    tack_distances = distances[mask]
+    max_distance = tack_distances.max()
+    if max_distance > 0:
+        weights = tack_distances * tack_distances
+        weights *= 0.5 / max_distance
+    else:
+        weights = tack_distances * 0.5
+    
+    for values, share in ((speeds, 0.3), (durations, 0.2)):
+        if values is None:
+            continue
+        tack_values = values[mask]
+        max_value = tack_values.max()
+        if max_value > 0:
+            tack_values *= share / max_value
+            weights += tack_values * tack_distances
+    
+    # The weighted mean is a single dot product rather than np.average's temporaries
+    total_weight = weights.sum()
+    if total_weight == 0:
+        # Same failure np.average reports; the caller falls back to the user's wind
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+    angle = float(angles[mask] @ weights / total_weight)
+    return angle, tack_distances.sum(), count
+
 def calculate_vmg_upwind(
     upwind_segments: pd.DataFrame,
     angle_range: float = 20,
@@ -109,56 +298,20 @@ def calculate_vmg_upwind(
         # Log suspicious segments
         suspicious_count = len(suspicious_segments) - len(filtered_upwind)
         if suspicious_count > 0:
-            logger.info(f"Excluded {suspicious_count} suspicious segments from VMG calculation")
-            if not suspicious_segments[suspicious_segments['suspicious']].empty:
-                logger.debug(f"Suspicious reasons: {suspicious_segments[suspicious_segments['suspicious']]['suspicious_reason'].value_counts().to_dict()}")
+            logger.info("Excluded %d suspicious segments from VMG calculation", suspicious_count)
+            # The reason breakdown costs a value_counts, so only build it when it is logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Suspicious reasons: %s",
+                             suspicious_segments.loc[suspicious_segments['suspicious'], 'suspicious_reason'].value_counts().to_dict())
         
         # If no segments remain after filtering, fall back to all segments
         if filtered_upwind.empty:
             logger.warning(f"No upwind segments remain after filtering. Using all upwind segments.")
             filtered_upwind = upwind_segments
         
-        if not filtered_upwind.empty:
-            # Step 2: Find best upwind angle weighted by distance
-            # For best upwind angle, we use a weighted percentile approach
-            # This balances between the absolute closest-to-wind angle and segment quality
-            
-            # Calculate the quality score for each segment
-            quality_scores = calculate_segment_quality_score(filtered_upwind)
-            
-            # The segment with the highest quality score and smallest angle is our "best" angle
-            # We combine quality and angle with a weighted approach
-            filtered_upwind['combined_score'] = filtered_upwind['angle_to_wind'] - (quality_scores * 10)
-            best_segment = filtered_upwind.sort_values('combined_score').iloc[0]
-            weighted_best_angle = best_segment['angle_to_wind']
-            
-            logger.info(f"Best upwind angle (distance-weighted): {weighted_best_angle:.1f}°")
-            
-            # Step 3: Filter to segments within range of best angle
-            max_angle_threshold = min(weighted_best_angle + angle_range, 90)
-            angle_filtered = filtered_upwind[filtered_upwind['angle_to_wind'] <= max_angle_threshold]
-            
-            if not angle_filtered.empty:
-                # Step 4: Calculate VMG for each segment
-                angle_filtered = angle_filtered.copy()  # Make a copy to avoid SettingWithCopyWarning
-                angle_filtered['vmg'] = angle_filtered.apply(
-                    lambda row: row['speed'] * math.cos(math.radians(row['angle_to_wind'])), axis=1
-                )
-                
-                # Log individual VMGs for debugging
-                logger.debug(f"Calculating VMG from {len(angle_filtered)} segments with angles: " +
-                           f"{angle_filtered['angle_to_wind'].tolist()}")
-                logger.debug(f"Individual VMGs: {angle_filtered['vmg'].tolist()}")
-                
-                # Step 5: Weight by distance
-                vmg_values = angle_filtered['vmg'].values
-                distance_weights = angle_filtered['distance'].values
-                
-                # Calculate weighted average VMG
-                total_distance = angle_filtered['distance'].sum()
-                if total_distance > 0:
-                    upwind_vmg = np.average(vmg_values, weights=distance_weights)
-                    logger.info(f"Calculated VMG upwind: {upwind_vmg:.2f} knots (from {len(angle_filtered)} segments)")
+        segments = SegmentArrays.from_frame(filtered_upwind)
+        if segments is not None:
+            upwind_vmg = _vmg_upwind_arrays(segments, angle_range)
     
     except Exception as e:
         logger.error(f"Error calculating upwind VMG: {e}")
@@ -186,59 +339,142 @@ def calculate_vmg_downwind(
     """
     downwind_vmg = None
     
-    if downwind_segments.empty:
-        return None
-    
     try:
-        # Step 1: Filter by minimum distance
-        filtered_downwind = downwind_segments[downwind_segments['distance'] >= min_segment_distance]
-        
-        # If no segments meet the minimum distance requirement, fall back to all segments
-        if filtered_downwind.empty:
-            logger.warning(f"No downwind segments meet the {min_segment_distance}m minimum distance. Using all downwind segments.")
-            filtered_downwind = downwind_segments
-        
-        if not filtered_downwind.empty:
-            # Step 2: Find best downwind angle weighted by distance
-            # For downwind, we want largest angle_to_wind (closest to 180°)
-            
-            # Calculate the quality score for each segment
-            quality_scores = calculate_segment_quality_score(filtered_downwind)
-            
-            # For downwind, higher angle is better, so we reverse the order with negative sign
-            filtered_downwind['combined_score'] = -filtered_downwind['angle_to_wind'] - (quality_scores * 10)
-            best_segment = filtered_downwind.sort_values('combined_score').iloc[0]
-            weighted_best_angle = best_segment['angle_to_wind']
-            
-            logger.info(f"Best downwind angle (distance-weighted): {weighted_best_angle:.1f}°")
-            
-            # Step 3: Filter to segments within range of best angle
-            # For downwind, we want angles LARGER than (best_angle - range)
-            min_angle_threshold = max(weighted_best_angle - angle_range, 90)
-            angle_filtered = filtered_downwind[filtered_downwind['angle_to_wind'] >= min_angle_threshold]
-            
-            if not angle_filtered.empty:
-                # Step 4: Calculate VMG for each segment
-                angle_filtered = angle_filtered.copy()  # Make a copy to avoid SettingWithCopyWarning
-                angle_filtered['vmg'] = angle_filtered.apply(
-                    lambda row: row['speed'] * math.cos(math.radians(180 - row['angle_to_wind'])), axis=1
-                )
-                
-                # Step 5: Weight by distance
-                vmg_values = angle_filtered['vmg'].values
-                distance_weights = angle_filtered['distance'].values
-                
-                # Calculate weighted average VMG
-                total_distance = angle_filtered['distance'].sum()
-                if total_distance > 0:
-                    downwind_vmg = np.average(vmg_values, weights=distance_weights)
-                    logger.info(f"Calculated VMG downwind: {downwind_vmg:.2f} knots (from {len(angle_filtered)} segments)")
+        # An empty frame or one without the needed columns has no VMG
+        segments = SegmentArrays.from_frame(downwind_segments)
+        if segments is not None:
+            downwind_vmg = _vmg_downwind_arrays(segments, angle_range, min_segment_distance)
     
     except Exception as e:
         logger.error(f"Error calculating downwind VMG: {e}")
     
     return downwind_vmg
 
+def _vmg_upwind_arrays(
+    upwind_segments: SegmentArrays,
+    angle_range: float
+) -> Optional[float]:
+    """
+    Distance-weighted VMG upwind from segment arrays.
+    
+    Helper of calculate_vmg_upwind, which screens out suspicious segments
+    (detect_suspicious_segments needs the full DataFrame) before calling this.
+    
+    Args:
+        upwind_segments: Screened upwind sailing segments
+        angle_range: Range around best angle to include (in degrees)
+    
+    Returns:
+        float: Distance-weighted VMG upwind or None if insufficient data
+    """
+    if len(upwind_segments) == 0:
+        return None
+    return _weighted_vmg(upwind_segments, angle_range, downwind=False)
+
+def _vmg_downwind_arrays(
+    downwind_segments: SegmentArrays,
+    angle_range: float,
+    min_segment_distance: float
+) -> Optional[float]:
+    """
+    Distance-weighted VMG downwind from segment arrays.
+    
+    Helper of calculate_vmg_downwind.
+    
+    Args:
+        downwind_segments: Downwind sailing segments
+        angle_range: Range around best angle to include (in degrees)
+        min_segment_distance: Minimum segment distance to consider (in meters)
+    
+    Returns:
+        float: Distance-weighted VMG downwind or None if insufficient data
+    """
+    if len(downwind_segments) == 0:
+        return None
+    
+    # Step 1: Filter by minimum distance
+    long_enough = downwind_segments.distance >= min_segment_distance
+    
+    # If no segments meet the minimum distance requirement, fall back to all segments
+    if long_enough.any():
+        downwind_segments = downwind_segments.select(long_enough)
+    else:
+        logger.warning(f"No downwind segments meet the {min_segment_distance}m minimum distance. Using all downwind segments.")
+    
+    return _weighted_vmg(downwind_segments, angle_range, downwind=True)
+
+def _weighted_vmg(
+    segments: SegmentArrays,
+    angle_range: float,
+    downwind: bool
+) -> Optional[float]:
+    """
+    Distance-weighted VMG over the segments near the best angle.
+    
+    Shared by _vmg_upwind_arrays and _vmg_downwind_arrays once they
+    have filtered their segments. Downwind mirrors upwind by negating angles
+    and VMG, so both directions pick their best segment with the same argmin.
+    
+    Args:
+        segments: Filtered, non-empty segments for one direction
+        angle_range: Range around best angle to include (in degrees)
+        downwind: True for downwind segments, False for upwind
+        
+    Returns:
+        float: Distance-weighted VMG or None if no segment qualifies
+    """
+    direction = 'downwind' if downwind else 'upwind'
+    sign = -1.0 if downwind else 1.0
+    angles = segments.angle_to_wind
+    speeds = segments.speed
+    distances = segments.distance
+    
+    # Step 2: Find best angle weighted by segment quality. Upwind the best angle is
+    # the smallest, downwind the largest (closest to 180°)
+    quality_scores = segments.quality_scores()
+    combined_score = sign * angles - quality_scores * 10
+    weighted_best_angle = angles[np.nanargmin(combined_score)]
+    
+    logger.info("Best %s angle (distance-weighted): %.1f°", direction, weighted_best_angle)
+    
+    # Step 3: Filter to segments within range of best angle, without crossing 90°
+    if downwind:
+        in_range = angles >= max(weighted_best_angle - angle_range, 90)
+    else:
+        in_range = angles <= min(weighted_best_angle + angle_range, 90)
+    
+    if not in_range.any():
+        return None
+    
+    # Step 4: Calculate VMG for each segment; downwind VMG is speed * cos(180° - angle)
+    # (computed in one scratch buffer instead of a temporary per operation)
+    angles = angles[in_range]
+    vmg_values = np.radians(angles)
+    np.cos(vmg_values, out=vmg_values)
+    np.multiply(vmg_values, speeds[in_range], out=vmg_values)
+    if downwind:
+        np.negative(vmg_values, out=vmg_values)
+    
+    # Log a VMG summary for debugging; only computed when DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Calculating VMG from %d segments with angles %.1f-%.1f°",
+                     len(angles), angles.min(), angles.max())
+        logger.debug("Individual VMGs: min %.2f, median %.2f, max %.2f",
+                     vmg_values.min(), np.median(vmg_values), vmg_values.max())
+    
+    # Step 5: Weight by distance
+    distance_weights = distances[in_range]
+    
+    # Calculate weighted average VMG; any() stops at the first non-zero distance,
+    # and np.average hands back the weight sum instead of a second reduction
+    if not distance_weights.any():
+        return None
+    
+    vmg, total_distance = np.average(vmg_values, weights=distance_weights, returned=True)
+    logger.info("Calculated VMG %s: %.2f knots (from %d segments, %.0f m)",
+                direction, vmg, len(angles), total_distance)
+    return vmg
+
 def estimate_wind_direction_weighted(
     stretches: pd.DataFrame,
     user_wind_direction: float,
@@ -255,7 +491,8 @@ def estimate_wind_direction_weighted(
     4. Returns a WindEstimate object with confidence score based on data quality
     
     Args:
-        stretches: DataFrame with sailing segments
+        stretches: DataFrame with sailing segments; a categorical 'tack' column
+            (as produced by analyze_wind_angles) is split on its codes
         user_wind_direction: User-provided initial wind direction (degrees)
         suspicious_angle_threshold: Angles less than this are considered suspicious (degrees)
         min_segment_distance: Minimum segment distance to consider (meters)
@@ -279,96 +516,88 @@ def estimate_wind_direction_weighted(
         logger.warning("No stretches provided for wind estimation")
         return result
     
-    # Ensure we have required columns
-    required_columns = ['angle_to_wind', 'tack', 'distance', 'bearing']
-    if not all(col in stretches.columns for col in required_columns):
-        missing = [col for col in required_columns if col not in stretches.columns]
-        logger.warning(f"Missing required columns for wind estimation: {missing}")
-        return result
-    
     try:
+        # Check the required columns and pull them out once (float64, as in
+        # SegmentArrays); every filter below is a boolean mask over them
+        arrays = _extract(stretches, ('angle_to_wind', 'distance', 'bearing'), optional=('speed', 'duration'))
+        if arrays is None or 'tack' not in stretches.columns:
+            missing = [col for col in _WIND_REQUIRED_COLUMNS if col not in stretches.columns]
+            logger.warning(f"Missing required columns for wind estimation: {missing}")
+            return result
+        angles = arrays['angle_to_wind']
+        distances = arrays['distance']
+        bearings = arrays['bearing']
+        speeds = arrays['speed']
+        durations = arrays['duration']
+        
         # Normalize user wind direction
         user_wind_direction = float(user_wind_direction) % 360
         
         # Step 1: Filter upwind segments (angle_to_wind < 90°)
-        upwind = stretches[stretches['angle_to_wind'] < 90].copy()
+        upwind = angles < 90
+        upwind_count = int(np.count_nonzero(upwind))
         
         # Step 2: Filter out suspicious segments using our enhanced analysis
-        suspicious_segments = detect_suspicious_segments(
-            upwind,
-            min_angle_to_wind=suspicious_angle_threshold,
-            min_segment_length=30.0  # 30 meters minimum for reliable segments
-        )
-        
-        # Keep only non-suspicious segments
-        upwind_filtered = suspicious_segments[~suspicious_segments['suspicious']]
-        
-        # Log the filtering results
-        logger.info(f"Filtered out {len(suspicious_segments) - len(upwind_filtered)} suspicious segments out of {len(upwind)}")
-        logger.info(f"Suspicious reasons: {suspicious_segments[suspicious_segments['suspicious']]['suspicious_reason'].value_counts().to_dict()}")
-        
-        # Update upwind segments to use filtered version
-        upwind = upwind_filtered
+        keep = upwind.copy()
+        if upwind_count:
+            suspicious_segments = detect_suspicious_segments(
+                stretches[upwind],
+                min_angle_to_wind=suspicious_angle_threshold,
+                min_segment_length=30.0  # 30 meters minimum for reliable segments
+            )
+            suspicious = suspicious_segments['suspicious'].to_numpy(dtype=bool)
+            keep[upwind] = ~suspicious
+            
+            # Log the filtering results
+            logger.info("Filtered out %d suspicious segments out of %d",
+                        int(np.count_nonzero(suspicious)), upwind_count)
+            # The reason breakdown costs a value_counts, so only build it when it is logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Suspicious reasons: %s",
+                            suspicious_segments.loc[suspicious, 'suspicious_reason'].value_counts().to_dict())
         
         # Step 3: Apply minimum distance filter
         if min_segment_distance > 0:
-            upwind_all = upwind.copy()  # Keep a copy before filtering
-            upwind = upwind[upwind['distance'] >= min_segment_distance]
-            logger.info(f"Filtered to {len(upwind)} upwind segments with distance >= {min_segment_distance}m")
+            long_enough = keep & (distances >= min_segment_distance)
+            long_count = int(np.count_nonzero(long_enough))
+            logger.info("Filtered to %d upwind segments with distance >= %sm", long_count, min_segment_distance)
             
             # If too few segments remain after filtering, fall back to all segments
-            if len(upwind) < 3 and len(upwind_all) >= 3:
-                logger.warning(f"Too few segments ({len(upwind)}) meet distance criteria. Using all upwind segments.")
-                upwind = upwind_all
+            if long_count < 3 and np.count_nonzero(keep) >= 3:
+                logger.warning(f"Too few segments ({long_count}) meet distance criteria. Using all upwind segments.")
+            else:
+                keep = long_enough
         
         # Need at least 3 segments for reliable estimation
-        if len(upwind) < 3:
-            logger.warning(f"Insufficient upwind segments ({len(upwind)}) for reliable wind estimation")
+        keep_count = int(np.count_nonzero(keep))
+        if keep_count < 3:
+            logger.warning(f"Insufficient upwind segments ({keep_count}) for reliable wind estimation")
             return result
         
-        # Step 4: Split by tack
-        port_tack = upwind[upwind['tack'] == 'Port']
-        starboard_tack = upwind[upwind['tack'] == 'Starboard']
+        # Step 4: Split by tack, restricted to the segments kept above
+        port_mask, starboard_mask = _tack_masks(stretches['tack'])
+        port_mask &= keep
+        starboard_mask &= keep
+        
+        # Step 5: Calculate weighted average angles for each tack
+        port_angle, port_total_distance, port_count = _tack_average(
+            angles, distances, speeds, durations, port_mask
+        )
+        starboard_angle, starboard_total_distance, starboard_count = _tack_average(
+            angles, distances, speeds, durations, starboard_mask
+        )
         
         # Need at least one segment in each tack for balanced estimation
-        has_both_tacks = len(port_tack) > 0 and len(starboard_tack) > 0
+        has_both_tacks = port_count > 0 and starboard_count > 0
         
         if not has_both_tacks:
-            logger.warning(f"Missing one tack: Port={len(port_tack)}, Starboard={len(starboard_tack)}")
+            logger.warning(f"Missing one tack: Port={port_count}, Starboard={starboard_count}")
             # We'll still try to estimate with one tack, but confidence will be low
         
-        # Step 5: Calculate weighted average angles for each tack
-        port_angle = None
-        port_total_distance = 0
-        if len(port_tack) > 0:
-            # Calculate quality scores
-            port_quality = calculate_segment_quality_score(port_tack)
-            
-            # Calculate combined weights (distance * quality)
-            port_weights = port_tack['distance'].values * port_quality.values
-            port_angles = port_tack['angle_to_wind'].values
-            
-            # Calculate weighted average angle
-            port_angle = np.average(port_angles, weights=port_weights)
-            port_total_distance = port_tack['distance'].sum()
-            
-            logger.info(f"Port tack weighted average angle: {port_angle:.1f}° (from {len(port_tack)} segments)")
-        
-        starboard_angle = None
-        starboard_total_distance = 0
-        if len(starboard_tack) > 0:
-            # Calculate quality scores
-            starboard_quality = calculate_segment_quality_score(starboard_tack)
-            
-            # Calculate combined weights (distance * quality)
-            starboard_weights = starboard_tack['distance'].values * starboard_quality.values
-            starboard_angles = starboard_tack['angle_to_wind'].values
-            
-            # Calculate weighted average angle
-            starboard_angle = np.average(starboard_angles, weights=starboard_weights)
-            starboard_total_distance = starboard_tack['distance'].sum()
-            
-            logger.info(f"Starboard tack weighted average angle: {starboard_angle:.1f}° (from {len(starboard_tack)} segments)")
+        if port_angle is not None:
+            logger.info("Port tack weighted average angle: %.1f° (from %d segments)", port_angle, port_count)
+        if starboard_angle is not None:
+            logger.info("Starboard tack weighted average angle: %.1f° (from %d segments)", starboard_angle, starboard_count)
         
         # Step 6: Use the angles to estimate wind direction
         estimated_wind = None
@@ -393,7 +622,7 @@ def estimate_wind_direction_weighted(
             wind_adjustment = angle_difference / 2.0
             estimated_wind = (user_wind_direction - wind_adjustment) % 360
             
-            logger.info(f"Estimated wind: {estimated_wind:.1f}° (adjustment: {wind_adjustment:.1f}°)")
+            logger.info("Estimated wind: %.1f° (adjustment: %.1f°)", estimated_wind, wind_adjustment)
             
             # Confidence level based on data quality and tack difference
             confidence = "medium"
@@ -402,14 +631,14 @@ def estimate_wind_direction_weighted(
             # 1. We have several segments in each tack
             # 2. Port and starboard angles are reasonably similar
             # 3. We have significant total distance
-            if (len(port_tack) >= 3 and len(starboard_tack) >= 3 and
+            if (port_count >= 3 and starboard_count >= 3 and
                 tack_difference < 20 and total_distance > 500):
                 confidence = "high"
             
             # Lower confidence if:
             # 1. Port and starboard angles differ greatly
             # 2. We have few segments in either tack
-            if tack_difference > 45 or (len(port_tack) < 2 or len(starboard_tack) < 2):
+            if tack_difference > 45 or (port_count < 2 or starboard_count < 2):
                 confidence = "low"
         else:
             # Single-tack estimation (less reliable)
@@ -417,19 +646,17 @@ def estimate_wind_direction_weighted(
             
             if port_angle is not None:
                 # For port tack, wind = bearing + angle_to_wind
-                port_bearings = port_tack['bearing'].values
                 # Take the weighted average bearing
-                port_bearing = np.average(port_bearings, weights=port_tack['distance'].values)
+                port_bearing = np.average(bearings[port_mask], weights=distances[port_mask])
                 estimated_wind = (port_bearing + port_angle) % 360
-                logger.info(f"Estimated wind from port tack only: {estimated_wind:.1f}°")
+                logger.info("Estimated wind from port tack only: %.1f°", estimated_wind)
             
             elif starboard_angle is not None:
                 # For starboard tack, wind = bearing - angle_to_wind
-                starboard_bearings = starboard_tack['bearing'].values
                 # Take the weighted average bearing
-                starboard_bearing = np.average(starboard_bearings, weights=starboard_tack['distance'].values)
+                starboard_bearing = np.average(bearings[starboard_mask], weights=distances[starboard_mask])
                 estimated_wind = (starboard_bearing - starboard_angle) % 360
-                logger.info(f"Estimated wind from starboard tack only: {estimated_wind:.1f}°")
+                logger.info("Estimated wind from starboard tack only: %.1f°", estimated_wind)
         
         # If we have an estimate, return it
         if estimated_wind is not None:
@@ -439,11 +666,11 @@ def estimate_wind_direction_weighted(
                 user_provided=False,
                 port_angle=port_angle,
                 starboard_angle=starboard_angle,
-                port_count=len(port_tack),
-                starboard_count=len(starboard_tack)
+                port_count=port_count,
+                starboard_count=starboard_count
             )
     
     except Exception as e:
         logger.error(f"Error in wind direction estimation: {e}")
     
-    return result
\ No newline at end of file
+    return result
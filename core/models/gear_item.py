@@ -5,6 +5,8 @@ This module contains the GearItem class for representing gear setups for compari
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
+import math
+import numpy as np
 import pandas as pd
 import json
 import uuid
@@ -12,6 +14,108 @@ from datetime import datetime
 
 from core.metrics_advanced import calculate_vmg_upwind, calculate_vmg_downwind
 
+def _best_angle(angles: np.ndarray, speeds: np.ndarray, mask: np.ndarray, largest: bool) -> Dict[str, Any]:
+    """Find the tightest (upwind) or deepest (downwind) angle among masked segments.
+    
+    Args:
+        angles: Angle to wind of every segment
+        speeds: Speed of every segment (already in knots)
+        mask: Segments to consider
+        largest: True to take the largest angle, False for the smallest
+        
+    Returns:
+        Dict[str, Any]: Angle and speed of the best segment, both None if the mask is empty
+    """
+    if not mask.any():
+        return {"angle": None, "speed": None}
+    
+    # Masked-out segments can never win; ties go to the first segment, like idxmin/idxmax
+    if largest:
+        best = np.argmax(np.where(mask, angles, -np.inf))
+    else:
+        best = np.argmin(np.where(mask, angles, np.inf))
+    return {"angle": angles[best], "speed": speeds[best]}
+
+def _stretch_metrics(stretches: pd.DataFrame) -> Dict[str, Any]:
+    """Compute the GearItem performance fields from a track's stretches.
+    
+    Args:
+        stretches: Non-empty track stretches with wind analysis columns
+        
+    Returns:
+        Dict[str, Any]: Upwind progress, VMG and best angle/speed fields
+    """
+    upwind_progress = None  # Legacy field
+    vmg_upwind = None  # New field
+    best_port_upwind = {"angle": None, "speed": None}
+    best_starboard_upwind = {"angle": None, "speed": None}
+    best_port_downwind = {"angle": None, "speed": None}
+    best_starboard_downwind = {"angle": None, "speed": None}
+    
+    # Split into upwind/downwind for analysis
+    # IMPORTANT: Speeds in stretches DataFrame are already in knots
+    # They were converted from m/s in core/segments/functions.py
+    # Pull the columns and masks out once; the best angles come from
+    # reductions over them rather than from per-tack frame copies
+    angles = stretches['angle_to_wind'].to_numpy(dtype=float)
+    speeds = stretches['speed'].to_numpy()
+    port = (stretches['tack'] == 'Port').to_numpy()
+    starboard = (stretches['tack'] == 'Starboard').to_numpy()
+    upwind = angles < 90
+    downwind = angles >= 90
+    
+    # Get upwind metrics
+    if upwind.any():
+        # Find best port and starboard tack upwind angles
+        best_port_upwind = _best_angle(angles, speeds, upwind & port, largest=False)
+        best_starboard_upwind = _best_angle(angles, speeds, upwind & starboard, largest=False)
+        
+        # Calculate improved VMG upwind using advanced algorithm
+        # Configuration for VMG calculations
+        min_segment_distance = 50  # Minimum segment distance in meters
+        angle_range = 20  # Range around best angle to include
+        
+        # Use the advanced distance-weighted algorithm
+        vmg_upwind = calculate_vmg_upwind(
+            stretches[upwind],
+            angle_range=angle_range,
+            min_segment_distance=min_segment_distance
+        )
+        
+        # Fallback to original method for backward compatibility
+        # Calculate upwind progress speed when we have both tacks
+        if all(best_port_upwind.values()) and all(best_starboard_upwind.values()):
+            # Simply average the angles
+            pointing_power = (best_port_upwind["angle"] + best_starboard_upwind["angle"]) / 2
+            
+            # Average speed
+            avg_upwind_speed = (best_port_upwind["speed"] + best_starboard_upwind["speed"]) / 2
+            
+            # Calculate upwind progress speed (legacy field)
+            upwind_progress = avg_upwind_speed * math.cos(math.radians(pointing_power))
+            
+            # Use this as fallback for VMG if we couldn't calculate it above
+            if vmg_upwind is None:
+                vmg_upwind = upwind_progress
+    
+    # Get downwind metrics: best port and starboard tack downwind angles
+    if downwind.any():
+        best_port_downwind = _best_angle(angles, speeds, downwind & port, largest=True)
+        best_starboard_downwind = _best_angle(angles, speeds, downwind & starboard, largest=True)
+    
+    return {
+        "upwind_progress_speed": upwind_progress,  # Legacy field
+        "vmg_upwind": vmg_upwind,
+        "best_port_upwind_angle": best_port_upwind["angle"],
+        "best_port_upwind_speed": best_port_upwind["speed"],
+        "best_starboard_upwind_angle": best_starboard_upwind["angle"],
+        "best_starboard_upwind_speed": best_starboard_upwind["speed"],
+        "best_port_downwind_angle": best_port_downwind["angle"],
+        "best_port_downwind_speed": best_port_downwind["speed"],
+        "best_starboard_downwind_angle": best_starboard_downwind["angle"],
+        "best_starboard_downwind_speed": best_starboard_downwind["speed"],
+    }
+
 @dataclass
 class GearItem:
     """Class representing a gear setup for comparison."""
@@ -63,96 +167,10 @@ class GearItem:
         metrics = session_state.get('track_metrics', {})
         
         # Extract performance metrics from track stretches if available
-        upwind_progress = None  # Legacy field
-        vmg_upwind = None  # New field
-        best_port_upwind = {"angle": None, "speed": None}
-        best_starboard_upwind = {"angle": None, "speed": None}
-        best_port_downwind = {"angle": None, "speed": None}
-        best_starboard_downwind = {"angle": None, "speed": None}
-        
-        if 'track_stretches' in session_state and session_state['track_stretches'] is not None:
-            stretches = session_state['track_stretches']
-            
-            # Split into upwind/downwind for analysis
-            # IMPORTANT: Speeds in stretches DataFrame are already in knots
-            # They were converted from m/s in core/segments.py
-            if not stretches.empty:
-                upwind = stretches[stretches['angle_to_wind'] < 90]
-                downwind = stretches[stretches['angle_to_wind'] >= 90]
-                
-                # Get upwind metrics
-                if not upwind.empty:
-                    port_upwind = upwind[upwind['tack'] == 'Port']
-                    starboard_upwind = upwind[upwind['tack'] == 'Starboard']
-                    
-                    # Find best port tack upwind angle
-                    if not port_upwind.empty and len(port_upwind) > 0:
-                        best_port = port_upwind.loc[port_upwind['angle_to_wind'].idxmin()]
-                        best_port_upwind = {
-                            "angle": best_port['angle_to_wind'],
-                            "speed": best_port['speed']  # Speed is already in knots in the UI
-                        }
-                    
-                    # Find best starboard tack upwind angle
-                    if not starboard_upwind.empty and len(starboard_upwind) > 0:
-                        best_starboard = starboard_upwind.loc[starboard_upwind['angle_to_wind'].idxmin()]
-                        best_starboard_upwind = {
-                            "angle": best_starboard['angle_to_wind'],
-                            "speed": best_starboard['speed']  # Speed is already in knots in the UI
-                        }
-                    
-                    # Calculate improved VMG upwind using advanced algorithm
-                    import math
-                    import numpy as np
-                    
-                    # Configuration for VMG calculations
-                    min_segment_distance = 50  # Minimum segment distance in meters
-                    angle_range = 20  # Range around best angle to include
-                    
-                    # Use the advanced distance-weighted algorithm
-                    if not upwind.empty:
-                        vmg_upwind = calculate_vmg_upwind(
-                            upwind,
-                            angle_range=angle_range,
-                            min_segment_distance=min_segment_distance
-                        )
-                    
-                    # Fallback to original method for backward compatibility
-                    # Calculate upwind progress speed when we have both tacks
-                    if all(best_port_upwind.values()) and all(best_starboard_upwind.values()):
-                        # Simply average the angles
-                        pointing_power = (best_port_upwind["angle"] + best_starboard_upwind["angle"]) / 2
-                        
-                        # Average speed
-                        avg_upwind_speed = (best_port_upwind["speed"] + best_starboard_upwind["speed"]) / 2
-                        
-                        # Calculate upwind progress speed (legacy field)
-                        upwind_progress = avg_upwind_speed * math.cos(math.radians(pointing_power))
-                        
-                        # Use this as fallback for VMG if we couldn't calculate it above
-                        if vmg_upwind is None:
-                            vmg_upwind = upwind_progress
-                
-                # Get downwind metrics
-                if not downwind.empty:
-                    port_downwind = downwind[downwind['tack'] == 'Port']
-                    starboard_downwind = downwind[downwind['tack'] == 'Starboard']
-                    
-                    # Find best port tack downwind angle
-                    if not port_downwind.empty:
-                        best_port = port_downwind.loc[port_downwind['angle_to_wind'].idxmax()]
-                        best_port_downwind = {
-                            "angle": best_port['angle_to_wind'],
-                            "speed": best_port['speed']  # Speed is already in knots in the UI
-                        }
-                    
-                    # Find best starboard tack downwind angle
-                    if not starboard_downwind.empty:
-                        best_starboard = starboard_downwind.loc[starboard_downwind['angle_to_wind'].idxmax()]
-                        best_starboard_downwind = {
-                            "angle": best_starboard['angle_to_wind'],
-                            "speed": best_starboard['speed']  # Speed is already in knots in the UI
-                        }
+        stretch_metrics = {}
+        stretches = session_state.get('track_stretches')
+        if stretches is not None and not stretches.empty:
+            stretch_metrics = _stretch_metrics(stretches)
         
         # Get average angles if available in session state
         angle_results = session_state.get('angle_results', {})
@@ -175,16 +193,7 @@ class GearItem:
             distance=metrics.get('distance'),
             duration=metrics.get('duration').total_seconds() / 60 if metrics.get('duration') else None,
             active_duration=metrics.get('active_duration').total_seconds() / 60 if metrics.get('active_duration') else None,
-            upwind_progress_speed=upwind_progress,  # Legacy field
-            vmg_upwind=vmg_upwind,
-            best_port_upwind_angle=best_port_upwind["angle"],
-            best_port_upwind_speed=best_port_upwind["speed"],
-            best_starboard_upwind_angle=best_starboard_upwind["angle"],
-            best_starboard_upwind_speed=best_starboard_upwind["speed"],
-            best_port_downwind_angle=best_port_downwind["angle"],
-            best_port_downwind_speed=best_port_downwind["speed"],
-            best_starboard_downwind_angle=best_starboard_downwind["angle"],
-            best_starboard_downwind_speed=best_starboard_downwind["speed"],
+            **stretch_metrics,
             avg_upwind_angle=avg_angle,
             avg_port_tack_angle=port_angle,
             avg_starboard_tack_angle=starboard_angle,
@@ -198,9 +207,9 @@ class GearItem:
         Returns:
             Dict[str, Any]: Dictionary representation of the GearItem
         """
-        return {
-            key: value for key, value in self.__dict__.items()
-        }
+        # The instance dict holds exactly the dataclass fields; copying it is a
+        # single C-level operation
+        return dict(self.__dict__)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GearItem":
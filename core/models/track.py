@@ -5,15 +5,37 @@ This module defines the core data structures for track analysis,
 providing type safety and encapsulation of track-related data.
 """
 
+import math
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Union, Any
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-@dataclass
+# Columns of Track.segments_dataframe that every segment has, with their dtypes
+_SEGMENT_COLUMNS = (
+    ('start_idx', np.int64),
+    ('end_idx', np.int64),
+    ('bearing', float),
+    ('distance', float),
+    ('duration', float),
+    ('speed', float),
+)
+
+# Wind analysis columns, in the order TrackSegment.to_dict writes them
+_SEGMENT_WIND_COLUMNS = (
+    'wind_direction', 'angle_to_wind', 'tack', 'sailing_type', 'upwind_downwind', 'suspicious', 'quality_score'
+)
+
+# Row labels TrackSegment.from_dataframe_row takes as fields
+_SEGMENT_ROW_FIELDS = frozenset([name for name, _ in _SEGMENT_COLUMNS] + list(_SEGMENT_WIND_COLUMNS))
+
+@dataclass(slots=True)
 class TrackPoint:
     """
     Single point in a GPS track.
+    
+    Slotted, as a track holds one instance per GPS fix.
     """
     latitude: float
     longitude: float
@@ -44,7 +66,187 @@ class TrackPoint:
         return self.speed * 1.94384  # m/s to knots
 
 
-@dataclass
+# Float columns of TrackPointArrays besides the coordinates; NaN marks a missing value
+_POINT_FLOAT_FIELDS = ('elevation', 'speed', 'bearing', 'distance')
+
+class TrackPointArrays:
+    """
+    Track points stored column-wise, one NumPy array per TrackPoint field.
+    
+    Float fields use NaN for missing values and times are datetime64[ns] in
+    UTC (NaT when missing), with the original timezone kept alongside.
+    Indexing or iterating yields TrackPoint objects built on demand.
+    """
+    __slots__ = ('latitude', 'longitude', 'elevation', 'time', 'speed', 'bearing', 'distance', 'tz')
+    
+    def __init__(
+        self,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        elevation: np.ndarray,
+        time: np.ndarray,
+        speed: np.ndarray,
+        bearing: np.ndarray,
+        distance: np.ndarray,
+        tz: Any = None
+    ):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.elevation = elevation
+        self.time = time
+        self.speed = speed
+        self.bearing = bearing
+        self.distance = distance
+        self.tz = tz
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'TrackPointArrays':
+        """
+        Take the point columns of a DataFrame.
+        
+        Args:
+            df: DataFrame with latitude and longitude columns and optionally
+                elevation, time, speed, bearing and distance
+            
+        Returns:
+            TrackPointArrays: The columns as arrays
+        """
+        n_points = len(df)
+        columns = {}
+        for name in _POINT_FLOAT_FIELDS:
+            if name in df.columns:
+                columns[name] = df[name].to_numpy(dtype=float, na_value=np.nan)
+            else:
+                columns[name] = np.full(n_points, np.nan)
+        
+        time, tz = _utc_times(df['time'] if 'time' in df.columns else [None] * n_points)
+        return cls(
+            latitude=df['latitude'].to_numpy(dtype=float),
+            longitude=df['longitude'].to_numpy(dtype=float),
+            time=time,
+            tz=tz,
+            **columns
+        )
+    
+    @classmethod
+    def from_points(cls, points: List[TrackPoint]) -> 'TrackPointArrays':
+        """
+        Collect a list of TrackPoint objects into arrays.
+        
+        Args:
+            points: Track points
+            
+        Returns:
+            TrackPointArrays: The points' fields as arrays
+        """
+        n_points = len(points)
+        columns = {
+            name: np.fromiter(
+                (np.nan if getattr(point, name) is None else getattr(point, name) for point in points),
+                dtype=float, count=n_points
+            )
+            for name in ('latitude', 'longitude') + _POINT_FLOAT_FIELDS
+        }
+        time, tz = _utc_times([point.time for point in points])
+        return cls(time=time, tz=tz, **columns)
+    
+    def __len__(self) -> int:
+        return len(self.latitude)
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[TrackPoint, 'TrackPointArrays']:
+        if isinstance(i, slice):
+            return TrackPointArrays(
+                tz=self.tz,
+                **{name: getattr(self, name)[i] for name in ('latitude', 'longitude', 'time') + _POINT_FLOAT_FIELDS}
+            )
+        
+        values = {name: getattr(self, name)[i].item() for name in _POINT_FLOAT_FIELDS}
+        time = self.time[i]
+        if np.isnat(time):
+            time = None
+        else:
+            time = pd.Timestamp(time)
+            if self.tz is not None:
+                time = time.tz_localize('UTC').tz_convert(self.tz)
+        
+        return TrackPoint(
+            latitude=self.latitude[i].item(),
+            longitude=self.longitude[i].item(),
+            time=time,
+            **{name: None if math.isnan(value) else value for name, value in values.items()}
+        )
+    
+    def __iter__(self) -> Iterator[TrackPoint]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrackPointArrays):
+            return NotImplemented
+        return (
+            self.tz == other.tz
+            and np.array_equal(self.time, other.time, equal_nan=True)
+            and all(
+                np.array_equal(getattr(self, name), getattr(other, name), equal_nan=True)
+                for name in ('latitude', 'longitude') + _POINT_FLOAT_FIELDS
+            )
+        )
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build a DataFrame over the columns.
+        
+        Returns:
+            DataFrame: One row per point, with times in their original timezone
+        """
+        time = pd.DatetimeIndex(self.time)
+        if self.tz is not None:
+            time = time.tz_localize('UTC').tz_convert(self.tz)
+        return pd.DataFrame({
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'elevation': self.elevation,
+            'time': time,
+            'speed': self.speed,
+            'bearing': self.bearing,
+            'distance': self.distance
+        })
+
+
+def _utc_times(times: Any) -> Tuple[np.ndarray, Any]:
+    """
+    Convert timestamps to datetime64[ns] in UTC.
+    
+    Timestamps in different timezones are aligned in UTC and reported in the
+    first point's timezone.
+    
+    Args:
+        times: Series or list of timestamps, None for missing ones
+        
+    Returns:
+        tuple: (datetime64[ns] array with NaT for missing times, timezone or None if naive)
+        
+    Raises:
+        ValueError: If timezone-aware and naive timestamps are mixed
+    """
+    series = pd.Series(times, dtype=object) if isinstance(times, list) else times
+    try:
+        converted = pd.to_datetime(series)
+    except ValueError:
+        converted = None
+    
+    if converted is None or converted.dtype == object:
+        stamps = [pd.Timestamp(value) for value in series.dropna()]
+        if any(stamp.tz is None for stamp in stamps):
+            raise ValueError("Track mixes timezone-aware and naive timestamps")
+        converted = pd.to_datetime(series, utc=True)
+        return converted.to_numpy(dtype='datetime64[ns]'), stamps[0].tz
+    
+    tz = getattr(converted.dtype, 'tz', None)
+    return converted.to_numpy(dtype='datetime64[ns]'), tz
+
+
+@dataclass(slots=True)
 class TrackSegment:
     """
     A segment of a track with consistent properties.
@@ -66,35 +268,16 @@ class TrackSegment:
     suspicious: bool = False
     quality_score: Optional[float] = None
     
+    # (angle_to_wind, speed, vmg) of the last vmg computation
+    _vmg_cache: Optional[Tuple[float, float, float]] = field(default=None, init=False, repr=False, compare=False)
+    
     @classmethod
     def from_dataframe_row(cls, row: pd.Series) -> 'TrackSegment':
         """Create a TrackSegment from a DataFrame row."""
-        segment = cls(
-            start_idx=row['start_idx'],
-            end_idx=row['end_idx'],
-            bearing=row['bearing'],
-            distance=row['distance'],
-            duration=row['duration'],
-            speed=row['speed']
-        )
-        
-        # Add wind analysis properties if available
-        if 'wind_direction' in row:
-            segment.wind_direction = row['wind_direction']
-        if 'angle_to_wind' in row:
-            segment.angle_to_wind = row['angle_to_wind']
-        if 'tack' in row:
-            segment.tack = row['tack']
-        if 'sailing_type' in row:
-            segment.sailing_type = row['sailing_type']
-        if 'upwind_downwind' in row:
-            segment.upwind_downwind = row['upwind_downwind']
-        if 'suspicious' in row:
-            segment.suspicious = row['suspicious']
-        if 'quality_score' in row:
-            segment.quality_score = row['quality_score']
-        
-        return segment
+        # One pass over the row's labels instead of a membership test and a label
+        # lookup per optional field; wind analysis fields without a column keep
+        # their defaults
+        return cls(**{name: value for name, value in row.items() if name in _SEGMENT_ROW_FIELDS})
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert segment to dictionary."""
@@ -139,17 +322,25 @@ class TrackSegment:
     @property
     def vmg(self) -> Optional[float]:
         """Calculate velocity made good."""
-        import math
         if self.angle_to_wind is None:
             return None
         
+        # The fields can still be assigned directly after construction, so the
+        # cached value is keyed on its inputs
+        cache = self._vmg_cache
+        if cache is not None and cache[0] == self.angle_to_wind and cache[1] == self.speed:
+            return cache[2]
+        
         # Use speed * cos(angle) for upwind, speed * -cos(angle) for downwind
         angle_rad = math.radians(self.angle_to_wind)
         if self.is_upwind:
-            return self.speed * math.cos(angle_rad)
+            vmg = self.speed * math.cos(angle_rad)
         else:
             angle_from_downwind = abs(180 - self.angle_to_wind)
-            return self.speed * math.cos(math.radians(angle_from_downwind))
+            vmg = self.speed * math.cos(math.radians(angle_from_downwind))
+        
+        self._vmg_cache = (self.angle_to_wind, self.speed, vmg)
+        return vmg
 
 
 @dataclass
@@ -158,51 +349,56 @@ class Track:
     Complete GPS track with derived metrics.
     """
     name: str
-    points: List[TrackPoint]
+    points: TrackPointArrays
     segments: List[TrackSegment] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Lists of TrackPoint objects are still accepted and stored column-wise
+        if not isinstance(self.points, TrackPointArrays):
+            self.points = TrackPointArrays.from_points(list(self.points))
+    
     @property
     def dataframe(self) -> pd.DataFrame:
         """Convert track points to DataFrame."""
-        data = []
-        for point in self.points:
-            data.append({
-                'latitude': point.latitude,
-                'longitude': point.longitude,
-                'elevation': point.elevation,
-                'time': point.time,
-                'speed': point.speed,
-                'bearing': point.bearing,
-                'distance': point.distance
-            })
-        return pd.DataFrame(data)
+        return self.points.to_dataframe()
     
     @property
     def segments_dataframe(self) -> pd.DataFrame:
         """Convert segments to DataFrame."""
-        data = []
-        for segment in self.segments:
-            data.append(segment.to_dict())
+        if not self.segments:
+            return pd.DataFrame()
+        
+        # Build the frame column by column rather than from a dict per segment
+        n_segments = len(self.segments)
+        data = {}
+        for name, dtype in _SEGMENT_COLUMNS:
+            data[name] = np.fromiter((getattr(segment, name) for segment in self.segments),
+                                     dtype=dtype, count=n_segments)
+        
+        # Wind analysis fields become columns when any segment has them; NaN marks
+        # the segments without, as in the per-segment dicts of to_dict
+        for name in _SEGMENT_WIND_COLUMNS:
+            values = [getattr(segment, name) for segment in self.segments]
+            if any(value is not None for value in values):
+                data[name] = [np.nan if value is None else value for value in values]
         return pd.DataFrame(data)
     
     @classmethod
     def from_dataframes(cls, name: str, points_df: pd.DataFrame, segments_df: Optional[pd.DataFrame] = None) -> 'Track':
         """Create a Track from DataFrames."""
-        # Convert points DataFrame to TrackPoint objects
-        points = []
-        for _, row in points_df.iterrows():
-            points.append(TrackPoint.from_dict(row))
+        # Points are stored column-wise, straight from the DataFrame's columns
+        points = TrackPointArrays.from_frame(points_df)
         
         # Create Track object
         track = cls(name=name, points=points)
         
         # Add segments if provided
         if segments_df is not None:
-            segments = []
-            for _, row in segments_df.iterrows():
-                segments.append(TrackSegment.from_dataframe_row(row))
-            track.segments = segments
+            track.segments = [
+                TrackSegment(**values)
+                for values in _rows_as_kwargs(segments_df, TrackSegment, exclude=('points',))
+            ]
         
         return track
     
@@ -224,4 +420,28 @@ class Track:
     
     def get_non_suspicious_segments(self) -> List[TrackSegment]:
         """Get all non-suspicious segments."""
-        return [segment for segment in self.segments if not segment.suspicious]
\ No newline at end of file
+        return [segment for segment in self.segments if not segment.suspicious]
+
+
+def _rows_as_kwargs(
+    df: pd.DataFrame,
+    model: type,
+    exclude: Tuple[str, ...] = ()
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of a DataFrame as keyword arguments for a dataclass.
+    
+    Only columns named after fields of the dataclass are passed; fields without
+    a column keep their defaults.
+    
+    Args:
+        df: DataFrame to convert
+        model: Dataclass whose fields select the columns
+        exclude: Field names never taken from the DataFrame
+        
+    Yields:
+        dict: Field values of one row
+    """
+    columns = [f.name for f in fields(model) if f.name in df.columns and f.name not in exclude]
+    for values in df[columns].itertuples(index=False, name=None):
+        yield dict(zip(columns, values))
@@ -16,6 +16,7 @@ from config.settings import (
     DEFAULT_MIN_SEGMENT_DISTANCE,
     DEFAULT_MIN_POINTS_FOR_SEGMENT
 )
+from core.metrics_advanced import _QUALITY_FACTORS
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +44,17 @@ class SegmentAnalyzer:
         """
         Initialize the analyzer with segments.
         
+        The segments are kept by reference rather than copied; the analyzer
+        never modifies them, and callers should not modify them in place
+        while the analyzer is in use.
+        
         Args:
             segments: DataFrame with segments to analyze
         """
-        self.segments = segments.copy()
+        self.segments = segments
+        
+        # (segments, groups) of the last calculate_segment_groups call
+        self._groups: Optional[Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]] = None
     
     def filter_segments(self, criteria: SegmentFilterCriteria) -> pd.DataFrame:
         """
@@ -58,29 +66,37 @@ class SegmentAnalyzer:
         Returns:
             DataFrame: Filtered segments
         """
-        result = self.segments.copy()
+        segments = self.segments
+        columns = segments.columns
+        
+        # Combine every active criterion into one mask over the column arrays, then
+        # select once; the result is always a new DataFrame
+        mask = np.ones(len(segments), dtype=bool)
+        
+        if 'angle_to_wind' in columns and criteria.min_angle_to_wind > 0:
+            mask &= segments['angle_to_wind'].to_numpy() >= criteria.min_angle_to_wind
         
-        # Apply each filter criterion
-        if 'angle_to_wind' in result.columns and criteria.min_angle_to_wind > 0:
-            result = result[result['angle_to_wind'] >= criteria.min_angle_to_wind]
+        if 'distance' in columns and criteria.min_distance > 0:
+            mask &= segments['distance'].to_numpy() >= criteria.min_distance
         
-        if 'distance' in result.columns and criteria.min_distance > 0:
-            result = result[result['distance'] >= criteria.min_distance]
+        if 'duration' in columns and criteria.min_duration > 0:
+            mask &= segments['duration'].to_numpy() >= criteria.min_duration
         
-        if 'duration' in result.columns and criteria.min_duration > 0:
-            result = result[result['duration'] >= criteria.min_duration]
+        if 'speed' in columns and criteria.min_speed > 0:
+            mask &= segments['speed'].to_numpy() >= criteria.min_speed
         
-        if 'speed' in result.columns and criteria.min_speed > 0:
-            result = result[result['speed'] >= criteria.min_speed]
+        if 'speed' in columns and criteria.max_speed is not None:
+            mask &= segments['speed'].to_numpy() <= criteria.max_speed
         
-        if 'speed' in result.columns and criteria.max_speed is not None:
-            result = result[result['speed'] <= criteria.max_speed]
+        # Labels are compared as Series, which for categorical columns (as from
+        # analyze_wind_angles) compares integer codes instead of strings
+        if 'tack' in columns and criteria.tack is not None:
+            mask &= (segments['tack'] == criteria.tack).to_numpy()
         
-        if 'tack' in result.columns and criteria.tack is not None:
-            result = result[result['tack'] == criteria.tack]
+        if 'upwind_downwind' in columns and criteria.upwind_downwind is not None:
+            mask &= (segments['upwind_downwind'] == criteria.upwind_downwind).to_numpy()
         
-        if 'upwind_downwind' in result.columns and criteria.upwind_downwind is not None:
-            result = result[result['upwind_downwind'] == criteria.upwind_downwind]
+        result = segments[mask]
         
         logger.info(f"Filtered segments: {len(self.segments)} -> {len(result)} segments")
         return result
@@ -97,51 +113,35 @@ class SegmentAnalyzer:
         Returns:
             DataFrame: Segments with added quality_score column
         """
-        # Make a copy to avoid modifying the original
-        result = self.segments.copy()
+        segments = self.segments
         
         # Ensure we have the necessary columns
         required_columns = ['distance', 'speed', 'duration']
-        missing_columns = [col for col in required_columns if col not in result.columns]
+        missing_columns = [col for col in required_columns if col not in segments.columns]
         if missing_columns:
             logger.warning(f"Missing columns for quality scoring: {missing_columns}")
-            return result
-        
-        # Normalize each metric to 0-1 range
-        if len(result) > 0:
-            # Distance normalization - higher is better
-            distance_max = result['distance'].max()
-            if distance_max > 0:
-                result['distance_norm'] = result['distance'] / distance_max
-            else:
-                result['distance_norm'] = 0
-            
-            # Duration normalization - higher is better
-            duration_max = result['duration'].max()
-            if duration_max > 0:
-                result['duration_norm'] = result['duration'] / duration_max
-            else:
-                result['duration_norm'] = 0
-            
-            # Speed consistency - use coefficient of variation if we have per-point data
-            # Otherwise, just use normalized speed
-            speed_max = result['speed'].max()
-            if speed_max > 0:
-                result['speed_norm'] = result['speed'] / speed_max
-            else:
-                result['speed_norm'] = 0
-            
-            # Calculate final score
-            result['quality_score'] = (
-                result['distance_norm'] * 0.5 +
-                result['speed_norm'] * 0.3 +
-                result['duration_norm'] * 0.2
-            )
-            
-            # Cleanup temporary columns
-            result = result.drop(['distance_norm', 'speed_norm', 'duration_norm'], axis=1)
-        
-        return result
+            return segments.copy()
+        
+        if len(segments) == 0:
+            return segments.copy()
+        
+        # Normalize each metric to 0-1 range by its maximum (NaN skipped, as in
+        # pandas; higher is better) and sum the weighted terms on the columns'
+        # float arrays. Speed consistency would need per-point data, so the
+        # normalized speed stands in for it. Each term is formed in one scratch
+        # buffer (the column arrays may be views of the segments, so they are
+        # never written); only the score is attached, to a new DataFrame via assign.
+        score = np.zeros(len(segments))
+        term = np.empty(len(segments))
+        for column, weight in _QUALITY_FACTORS:
+            values = segments[column].to_numpy(dtype=float)
+            column_max = np.fmax.reduce(values)
+            if column_max > 0:
+                np.divide(values, column_max, out=term)
+                term *= weight
+                score += term
+        
+        return segments.assign(quality_score=score)
     
     def detect_suspicious_segments(self, angle_threshold: float = DEFAULT_SUSPICIOUS_ANGLE_THRESHOLD) -> pd.DataFrame:
         """
@@ -153,16 +153,14 @@ class SegmentAnalyzer:
         Returns:
             DataFrame: Segments with added suspicious column
         """
-        result = self.segments.copy()
-        
         # Ensure we have the angle_to_wind column
-        if 'angle_to_wind' not in result.columns:
+        if 'angle_to_wind' not in self.segments.columns:
             logger.warning("angle_to_wind column missing, cannot detect suspicious segments")
-            result['suspicious'] = False
-            return result
+            return self.segments.assign(suspicious=False)
         
-        # Mark segments with angle_to_wind less than threshold as suspicious
-        result['suspicious'] = result['angle_to_wind'] < angle_threshold
+        # Mark segments with angle_to_wind less than threshold as suspicious; assign
+        # adds the column to a new DataFrame
+        result = self.segments.assign(suspicious=self.segments['angle_to_wind'] < angle_threshold)
         
         suspicious_count = result['suspicious'].sum()
         logger.info(f"Detected {suspicious_count} suspicious segments out of {len(result)}")
@@ -198,9 +196,20 @@ class SegmentAnalyzer:
         """
         Group segments by tack and upwind/downwind.
         
+        The groups are computed once per segments DataFrame and shared by the
+        analyze_* methods; the group DataFrames must not be modified.
+        
         Returns:
             Dict: Dictionary mapping group names to segment DataFrames
         """
+        if self._groups is None or self._groups[0] is not self.segments:
+            self._groups = (self.segments, self._group_segments())
+        return dict(self._groups[1])
+    
+    def _group_segments(self) -> Dict[str, pd.DataFrame]:
+        """
+        Uncached implementation of calculate_segment_groups.
+        """
         result = {}
         
         # Ensure we have the necessary columns
@@ -208,27 +217,28 @@ class SegmentAnalyzer:
             logger.warning("tack or upwind_downwind columns missing, cannot group segments")
             return result
         
+        # Compare each label column once; every group, the combinations included,
+        # is then one boolean selection from the segments (for categorical labels
+        # the comparisons run on integer codes)
+        segments = self.segments
+        port = (segments['tack'] == 'Port').to_numpy()
+        starboard = (segments['tack'] == 'Starboard').to_numpy()
+        upwind = (segments['upwind_downwind'] == 'Upwind').to_numpy()
+        downwind = (segments['upwind_downwind'] == 'Downwind').to_numpy()
+        
         # Group by tack
-        port_tack = self.segments[self.segments['tack'] == 'Port']
-        starboard_tack = self.segments[self.segments['tack'] == 'Starboard']
-        result['port'] = port_tack
-        result['starboard'] = starboard_tack
+        result['port'] = segments[port]
+        result['starboard'] = segments[starboard]
         
         # Group by upwind/downwind
-        upwind = self.segments[self.segments['upwind_downwind'] == 'Upwind']
-        downwind = self.segments[self.segments['upwind_downwind'] == 'Downwind']
-        result['upwind'] = upwind
-        result['downwind'] = downwind
+        result['upwind'] = segments[upwind]
+        result['downwind'] = segments[downwind]
         
         # Group by combination
-        port_upwind = port_tack[port_tack['upwind_downwind'] == 'Upwind']
-        port_downwind = port_tack[port_tack['upwind_downwind'] == 'Downwind']
-        starboard_upwind = starboard_tack[starboard_tack['upwind_downwind'] == 'Upwind']
-        starboard_downwind = starboard_tack[starboard_tack['upwind_downwind'] == 'Downwind']
-        result['port_upwind'] = port_upwind
-        result['port_downwind'] = port_downwind
-        result['starboard_upwind'] = starboard_upwind
-        result['starboard_downwind'] = starboard_downwind
+        result['port_upwind'] = segments[port & upwind]
+        result['port_downwind'] = segments[port & downwind]
+        result['starboard_upwind'] = segments[starboard & upwind]
+        result['starboard_downwind'] = segments[starboard & downwind]
         
         return result
     
@@ -290,34 +300,51 @@ class SegmentAnalyzer:
             logger.warning("angle_to_wind column missing, cannot analyze angle distribution")
             return {}
         
-        # Calculate statistics for the full dataset
-        angles = self.segments['angle_to_wind']
+        # Calculate statistics for the full dataset; the minimum, quartiles, median
+        # and maximum come from one quantile call
+        (min_angle, quartile_25, median_angle, quartile_75, max_angle), mean_angle, std_dev = \
+            _angle_statistics(self.segments['angle_to_wind'])
         
         result = {
-            'min_angle': angles.min(),
-            'max_angle': angles.max(),
-            'mean_angle': angles.mean(),
-            'median_angle': angles.median(),
-            'std_dev': angles.std(),
-            'quartile_25': angles.quantile(0.25),
-            'quartile_75': angles.quantile(0.75)
+            'min_angle': min_angle,
+            'max_angle': max_angle,
+            'mean_angle': mean_angle,
+            'median_angle': median_angle,
+            'std_dev': std_dev,
+            'quartile_25': quartile_25,
+            'quartile_75': quartile_75
         }
         
         # Add separate upwind and downwind statistics
         groups = self.calculate_segment_groups()
         
-        if 'upwind' in groups and not groups['upwind'].empty:
-            upwind_angles = groups['upwind']['angle_to_wind']
-            result['upwind_min_angle'] = upwind_angles.min()
-            result['upwind_max_angle'] = upwind_angles.max()
-            result['upwind_mean_angle'] = upwind_angles.mean()
-            result['upwind_median_angle'] = upwind_angles.median()
-        
-        if 'downwind' in groups and not groups['downwind'].empty:
-            downwind_angles = groups['downwind']['angle_to_wind']
-            result['downwind_min_angle'] = downwind_angles.min()
-            result['downwind_max_angle'] = downwind_angles.max()
-            result['downwind_mean_angle'] = downwind_angles.mean()
-            result['downwind_median_angle'] = downwind_angles.median()
-        
-        return result
\ No newline at end of file
+        for direction in ('upwind', 'downwind'):
+            if direction in groups and not groups[direction].empty:
+                (min_angle, _, median_angle, _, max_angle), mean_angle, _ = \
+                    _angle_statistics(groups[direction]['angle_to_wind'])
+                result[f'{direction}_min_angle'] = min_angle
+                result[f'{direction}_max_angle'] = max_angle
+                result[f'{direction}_mean_angle'] = mean_angle
+                result[f'{direction}_median_angle'] = median_angle
+        
+        return result
+
+
+def _angle_statistics(angles: pd.Series) -> Tuple[np.ndarray, float, float]:
+    """
+    Summary statistics of angles, skipping NaN like the pandas reductions.
+    
+    Args:
+        angles: Angles to wind in degrees
+        
+    Returns:
+        tuple: (min, 25th percentile, median, 75th percentile, max), mean and
+        sample standard deviation; NaN where there are too few angles
+    """
+    values = angles.to_numpy(dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.full(5, np.nan), np.nan, np.nan
+    
+    std_dev = values.std(ddof=1) if len(values) > 1 else np.nan
+    return np.quantile(values, [0.0, 0.25, 0.5, 0.75, 1.0]), values.mean(), std_dev
@@ -0,0 +1,188 @@
+"""
+Segment detection and analysis.
+
+This module contains functions for detecting and analyzing consistent segments
+in track data, such as upwind and downwind runs.
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+from utils.geo import (
+    MPS_TO_KNOTS,
+    calculate_track_hops,
+    meters_per_second_to_knots
+)
+
+logger = logging.getLogger(__name__)
+
+# Fixed category sets for the labels produced by analyze_wind_angles
+TACK_CATEGORIES = ['Port', 'Starboard']
+UPWIND_DOWNWIND_CATEGORIES = ['Upwind', 'Downwind']
+SAILING_TYPE_CATEGORIES = [
+    f"{direction} {tack}" for direction in UPWIND_DOWNWIND_CATEGORIES for tack in TACK_CATEGORIES
+]
+
+def find_consistent_angle_stretches(
+    df: pd.DataFrame, 
+    angle_tolerance: float, 
+    min_duration_seconds: float, 
+    min_distance_meters: float
+) -> pd.DataFrame:
+    """
+    Find stretches of consistent sailing angle in track data.
+    
+    Args:
+        df: DataFrame with track data (must contain latitude, longitude columns)
+        angle_tolerance: Maximum angle variation allowed within a stretch
+        min_duration_seconds: Minimum duration in seconds for a valid stretch
+        min_distance_meters: Minimum distance in meters for a valid stretch
+        
+    Returns:
+        DataFrame: Detected stretches with their properties
+    """
+    # Debug: Add more detailed logging for segment detection
+    logger.info(f"Finding consistent angle stretches with tolerance={angle_tolerance}°, "
+               f"min_duration={min_duration_seconds}s, min_distance={min_distance_meters}m")
+    if len(df) < 2:
+        return pd.DataFrame()
+    
+    # Calculate bearing and distance for each point in one vectorized pass
+    lats = df['latitude'].to_numpy(dtype=float)
+    lons = df['longitude'].to_numpy(dtype=float)
+    bearings, distances = calculate_track_hops(lats, lons)
+    
+    # Repeat the last value to match length of dataframe. The per-point values are
+    # kept as plain arrays rather than added to a copy of the whole track frame.
+    bearings = np.append(bearings, bearings[-1])
+    distances = np.append(distances, distances[-1])
+    
+    # Find where each stretch starts. A point ends the current stretch when its
+    # bearing strays from the stretch's first bearing, so each comparison depends
+    # on the previous split and the scan stays sequential (a diff of consecutive
+    # bearings would let slow drifts run on); it runs over plain floats, and
+    # everything after it is vectorized.
+    n_points = len(df)
+    bearing_values = bearings.tolist()
+    starts = [0]
+    start_bearing = bearing_values[0]
+    for i, bearing in enumerate(bearing_values[1:], start=1):
+        # Both ways round must exceed the tolerance, i.e. the smaller angle does
+        if (bearing - start_bearing) % 360 > angle_tolerance and (start_bearing - bearing) % 360 > angle_tolerance:
+            starts.append(i)
+            start_bearing = bearing
+    
+    starts = np.array(starts)
+    ends = np.append(starts[1:] - 1, n_points - 1)
+    
+    # Distance of each stretch, including the hop to the point after it
+    total_distances = np.add.reduceat(distances, starts)
+    
+    # Duration from the first to the last point's time; NaT gives NaN, which
+    # fails the minimum below. Tracks without any times count as zero duration.
+    times = None
+    if 'time' in df.columns:
+        times = pd.to_datetime(df['time']).to_numpy(dtype='datetime64[ns]')
+        if np.isnat(times).all():
+            times = None
+    if times is not None:
+        durations = (times[ends] - times[starts]) / np.timedelta64(1, 's')
+    else:
+        durations = np.zeros(len(starts))
+    
+    # A stretch cut short by a turn needs more than one point; the final stretch
+    # is always considered. Only keep stretches that meet BOTH minimum criteria.
+    keep = (ends > starts) | (ends == n_points - 1)
+    keep &= (durations >= min_duration_seconds) & (total_distances >= min_distance_meters)
+    
+    # Every stretch, the trailing one included, goes through the same arrays, and
+    # an empty selection still yields the typed columns
+    durations = durations[keep]
+    total_distances = total_distances[keep]
+    speeds = np.zeros(len(durations))
+    np.divide(total_distances, durations, out=speeds, where=durations > 0)
+    
+    result_df = pd.DataFrame({
+        'start_idx': starts[keep],
+        'end_idx': ends[keep],
+        'bearing': bearings[starts[keep]],
+        'distance': total_distances,
+        'duration': durations,
+        # Convert speed from m/s to knots
+        'speed': speeds * MPS_TO_KNOTS
+    })
+    
+    # Log the found stretches for debugging
+    logger.info("Found %d stretches with bearings: %s", len(result_df), result_df['bearing'].tolist())
+    
+    return result_df
+
+def analyze_wind_angles(stretches: pd.DataFrame, wind_direction: float) -> pd.DataFrame:
+    """
+    Calculate angles relative to wind and determine tack.
+    
+    Args:
+        stretches: DataFrame with sailing segments
+        wind_direction: Wind direction in degrees (0-359)
+        
+    Returns:
+        DataFrame: Updated stretches with wind angle information
+    """
+    if stretches.empty:
+        return stretches
+    
+    # Angle to wind (as in utils.geo.angle_to_wind) and tack both follow from one
+    # modular difference between the bearings and the wind direction
+    offset = (stretches['bearing'].to_numpy(dtype=float) - wind_direction) % 360
+    port = offset <= 180
+    angles = np.where(port, offset, 360 - offset)
+    
+    small_angles = angles < 15
+    if small_angles.any():
+        logger.warning(f"Suspiciously small angle to wind detected for {small_angles.sum()} segments "
+                      f"(wind: {wind_direction}°)")
+    
+    # Tack and upwind/downwind as category codes (Port/Upwind first); the combined
+    # sailing type is their cross product, so its code is 2 * direction + tack
+    # and no per-row label strings are built at all
+    tack_codes = (~port).astype(np.int8)
+    upwind = angles < 90
+    direction_codes = (~upwind).astype(np.int8)
+    sailing_type_codes = 2 * direction_codes + tack_codes
+    
+    # Store the labels as categoricals so equality masks compare integer codes
+    wind_columns = {
+        # The wind direction for reference
+        'wind_direction': np.full(len(stretches), wind_direction),
+        'angle_to_wind': angles,
+        'tack': pd.Categorical.from_codes(tack_codes, categories=TACK_CATEGORIES),
+        'upwind_downwind': pd.Categorical.from_codes(direction_codes, categories=UPWIND_DOWNWIND_CATEGORIES),
+        # Combined category for coloring and display
+        'sailing_type': pd.Categorical.from_codes(sailing_type_codes, categories=SAILING_TYPE_CATEGORIES),
+    }
+    
+    # Build the result around the caller's existing columns without copying them
+    # (the input itself is left unmodified); columns from an earlier analysis are
+    # replaced in place, new ones go at the end
+    columns = {
+        name: wind_columns.pop(name) if name in wind_columns else stretches[name]
+        for name in stretches.columns
+    }
+    columns.update(wind_columns)
+    result = pd.DataFrame(columns, index=stretches.index, copy=False)
+    
+    # Log a summary of the tacks. All four counts come from one bincount over the
+    # sailing type codes (Upwind/Downwind x Port/Starboard), and only when logged.
+    if logger.isEnabledFor(logging.INFO):
+        upwind_port, upwind_stbd, downwind_port, downwind_stbd = np.bincount(
+            sailing_type_codes, minlength=len(SAILING_TYPE_CATEGORIES)
+        ).tolist()
+        
+        logger.info("Wind direction: %s°", wind_direction)
+        logger.info("Tack summary: %d Port, %d Starboard",
+                    upwind_port + downwind_port, upwind_stbd + downwind_stbd)
+        logger.info("Direction summary: %d Upwind, %d Downwind",
+                    upwind_port + upwind_stbd, downwind_port + downwind_stbd)
+    
+    return result
\ No newline at end of file
@@ -26,9 +26,17 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Decimal places for the renamed columns of the segment display table
+DISPLAY_ROUNDING = {
+    'heading (°)': 1,
+    'angle off wind (°)': 1,
+    'distance (m)': 1,
+    'speed (knots)': 2
+}
+
+@dataclass(frozen=True)
 class SegmentDetectionParams:
-    """Parameters for segment detection and filtering."""
+    """Parameters for segment detection and filtering (immutable, so usable as a cache key)."""
     angle_tolerance: float = DEFAULT_ANGLE_TOLERANCE
     min_duration: float = DEFAULT_MIN_DURATION
     min_distance: float = DEFAULT_MIN_DISTANCE
@@ -271,12 +279,11 @@ class SegmentService:
             suspicious_angle_threshold = StateManager.get(
                 'suspicious_angle_threshold', DEFAULT_SUSPICIOUS_ANGLE_THRESHOLD)
         
-        # Make a copy to avoid modifying the original
-        display_df = segments.copy()
+        # reset_index returns a new frame, so the original is never modified
+        display_df = segments.reset_index()
         
         # Add original index for reference
-        display_df['original_index'] = display_df.index
-        display_df = display_df.reset_index()
+        display_df['original_index'] = display_df['index']
         
         # Mark suspicious segments
         if 'angle_to_wind' in display_df.columns:
@@ -287,7 +294,7 @@ class SegmentService:
             display_df['suspicious'] = False
         
         # Rename columns for user-friendly display
-        display_df = display_df.rename(columns={
+        display_df.rename(inplace=True, columns={
             'index': 'segment_id',
             'bearing': 'heading (°)',
             'angle_to_wind': 'angle off wind (°)',
@@ -296,15 +303,7 @@ class SegmentService:
             'duration': 'duration (sec)'
         })
         
-        # Format values for display
-        for col in ['heading (°)', 'angle off wind (°)']:
-            if col in display_df.columns:
-                display_df[col] = display_df[col].round(1)
-        
-        if 'distance (m)' in display_df.columns:
-            display_df['distance (m)'] = display_df['distance (m)'].round(1)
-        
-        if 'speed (knots)' in display_df.columns:
-            display_df['speed (knots)'] = display_df['speed (knots)'].round(2)
+        # Format values for display in one pass (absent columns are ignored)
+        display_df = display_df.round(DISPLAY_ROUNDING)
         
         return display_df
\ No newline at end of file
@@ -22,13 +22,11 @@ from core.metrics_advanced import (
 )
 from config.settings import (
     DEFAULT_SUSPICIOUS_ANGLE_THRESHOLD,
-    DEFAULT_WIND_DIRECTION
+    DEFAULT_WIND_DIRECTION,
+    DEFAULT_MIN_SEGMENT_DISTANCE,
+    DEFAULT_VMG_ANGLE_RANGE
 )
 
-# Advanced algorithm configuration
-DEFAULT_MIN_SEGMENT_DISTANCE = 50  # Minimum segment distance for algorithms in meters
-DEFAULT_VMG_ANGLE_RANGE = 20       # Range around best angle to include for VMG calculation
-
 logger = logging.getLogger(__name__)
 
 @dataclass
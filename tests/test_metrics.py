@@ -0,0 +1,53 @@
+"""
+Tests for track metric calculations.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.metrics import calculate_track_metrics
+from tests.test_segments import make_track
+
+
+def test_calculate_track_metrics_speeds_and_distance():
+    # 60 s at 6 m/s followed by 60 s drifting at 1 m/s
+    track = make_track([(90, 6, 60), (90, 1, 60)])
+    metrics = calculate_track_metrics(track, min_speed_knots=5.0)
+
+    assert np.isclose(metrics['distance'], 0.42, rtol=1e-3)
+    assert metrics['total_duration_seconds'] == 120
+    assert metrics['active_duration'].total_seconds() == 60
+    assert np.isclose(metrics['weighted_avg_speed'], 6 * 1.94384, rtol=1e-3)
+    assert np.isclose(metrics['overall_avg_speed'], 3.5 * 1.94384, rtol=1e-3)
+
+
+def test_calculate_track_metrics_skips_zero_duration_hops():
+    track = make_track([(90, 6, 60)])
+    # Repeat a fix with the same timestamp, as some GPS exports do
+    track = pd.concat([track.iloc[:30], track.iloc[29:]], ignore_index=True)
+    metrics = calculate_track_metrics(track, min_speed_knots=5.0)
+
+    assert metrics['active_duration'].total_seconds() == 60
+    assert np.isclose(metrics['weighted_avg_speed'], 6 * 1.94384, rtol=1e-3)
+
+
+def test_calculate_track_metrics_single_point():
+    metrics = calculate_track_metrics(make_track([]))
+
+    assert metrics['distance'] == 0
+    assert metrics['avg_speed'] == 0
+
+
+def test_calculate_track_metrics_skips_hops_with_missing_time():
+    track = make_track([(90, 6, 60)])
+    track.loc[10, 'time'] = pd.NaT
+    metrics = calculate_track_metrics(track, min_speed_knots=5.0)
+
+    # The two hops touching the missing fix have no duration but still add distance
+    assert metrics['active_duration'].total_seconds() == 58
+    assert np.isclose(metrics['distance'], 0.36, rtol=1e-3)
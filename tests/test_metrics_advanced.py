@@ -0,0 +1,124 @@
+"""
+Tests for distance-weighted VMG and wind estimation.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.metrics_advanced import (
+    SegmentArrays,
+    calculate_segment_quality_score,
+    calculate_vmg_downwind,
+    calculate_vmg_upwind,
+    estimate_wind_direction_weighted,
+)
+
+
+def test_quality_score_weights_each_factor():
+    segments = pd.DataFrame(
+        {'distance': [10.0, 50.0, 100.0], 'speed': [5.0, 10.0, 12.0], 'duration': [30.0, 60.0, 0.0]},
+        index=[3, 7, 9]
+    )
+    score = calculate_segment_quality_score(segments)
+
+    assert list(score.index) == [3, 7, 9]
+    np.testing.assert_allclose(score, [0.275, 0.7, 0.8])
+
+
+def test_quality_score_without_distances_uses_equal_distance_term():
+    segments = pd.DataFrame({'distance': [0.0, 0.0], 'speed': [5.0, 10.0]})
+    np.testing.assert_allclose(calculate_segment_quality_score(segments), [0.65, 0.8])
+    np.testing.assert_allclose(calculate_segment_quality_score(segments.drop(columns='distance')), [0.65, 0.8])
+
+
+def test_quality_score_empty():
+    assert calculate_segment_quality_score(pd.DataFrame()).empty
+
+
+def make_segments():
+    """Upwind and downwind segments on both tacks, roughly symmetric about the wind."""
+    return pd.DataFrame({
+        'start_idx': np.arange(0, 900, 100),
+        'end_idx': np.arange(90, 990, 100),
+        'bearing': [45.0, 318.0, 50.0, 312.0, 40.0, 320.0, 140.0, 220.0, 150.0],
+        'angle_to_wind': [45.0, 42.0, 50.0, 48.0, 40.0, 40.0, 140.0, 140.0, 150.0],
+        'tack': ['Port', 'Starboard', 'Port', 'Starboard', 'Port', 'Starboard', 'Port', 'Starboard', 'Port'],
+        'distance': [300.0, 250.0, 200.0, 220.0, 180.0, 260.0, 400.0, 350.0, 300.0],
+        'speed': [15.0, 14.0, 16.0, 15.0, 13.0, 14.0, 20.0, 19.0, 21.0],
+        'duration': [40.0, 35.0, 25.0, 30.0, 28.0, 37.0, 40.0, 36.0, 28.0],
+    })
+
+
+def test_vmg_does_not_modify_input():
+    segments = make_segments()
+    before = segments.copy()
+
+    upwind = segments[segments['angle_to_wind'] < 90]
+    downwind = segments[segments['angle_to_wind'] >= 90]
+    # A minimum distance nobody meets forces the fallback to the caller's frames
+    assert calculate_vmg_upwind(upwind, min_segment_distance=1000) is not None
+    assert calculate_vmg_downwind(downwind, min_segment_distance=1000) is not None
+
+    pd.testing.assert_frame_equal(segments, before)
+    assert 'combined_score' not in upwind.columns
+    assert 'combined_score' not in downwind.columns
+
+
+def test_estimate_wind_direction_weighted_balances_tacks():
+    estimate = estimate_wind_direction_weighted(make_segments(), 0)
+
+    assert not estimate.user_provided
+    assert estimate.confidence == 'high'
+    assert (estimate.port_count, estimate.starboard_count) == (3, 3)
+    assert np.isclose(estimate.port_angle, 45.2512, atol=1e-4)
+    assert np.isclose(estimate.starboard_angle, 42.9591, atol=1e-4)
+    assert np.isclose(estimate.direction, 1.1461, atol=1e-4)
+
+
+def test_estimate_wind_direction_weighted_single_tack():
+    segments = make_segments()
+    estimate = estimate_wind_direction_weighted(segments[segments['tack'] == 'Port'], 0)
+
+    assert estimate.confidence == 'low'
+    assert estimate.starboard_angle is None
+    assert np.isclose(estimate.direction, 90.3983, atol=1e-4)
+
+
+def test_estimate_wind_direction_weighted_categorical_tack():
+    segments = make_segments()
+    categorical = segments.assign(tack=pd.Categorical(segments['tack'], categories=['Port', 'Starboard']))
+
+    assert estimate_wind_direction_weighted(categorical, 0) == estimate_wind_direction_weighted(segments, 0)
+
+
+def test_vmg_upwind_and_downwind():
+    segments = make_segments()
+    upwind = segments[segments['angle_to_wind'] < 90]
+    downwind = segments[segments['angle_to_wind'] >= 90]
+
+    assert np.isclose(calculate_vmg_upwind(upwind), 10.3752, atol=1e-4)
+    assert np.isclose(calculate_vmg_downwind(downwind), 15.8843, atol=1e-4)
+    # A narrow range keeps only the segments nearest the best angle
+    assert np.isclose(calculate_vmg_downwind(downwind, angle_range=5), 18.1865, atol=1e-4)
+
+
+def test_vmg_upwind_screens_suspicious_segments():
+    segments = make_segments()
+    upwind = segments[segments['angle_to_wind'] < 90]
+    # A long, fast segment at an impossible 8° would otherwise set the best angle
+    with_suspicious = pd.concat([upwind, upwind.iloc[[0]].assign(angle_to_wind=8.0, speed=25.0, distance=500.0)])
+
+    assert calculate_vmg_upwind(with_suspicious) == calculate_vmg_upwind(upwind)
+
+
+def test_segment_arrays_quality_scores_match_dataframe():
+    segments = make_segments()
+    np.testing.assert_allclose(
+        SegmentArrays.from_frame(segments).quality_scores(), calculate_segment_quality_score(segments)
+    )
+
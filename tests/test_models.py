@@ -0,0 +1,105 @@
+"""
+Tests for the track data models.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.models.gear_item import GearItem
+from core.models.track import Track, TrackPoint, TrackPointArrays, TrackSegment
+
+
+def test_track_from_dataframes():
+    points = pd.DataFrame({
+        'latitude': [18.45, 18.46],
+        'longitude': [-66.04, -66.03],
+        'time': pd.to_datetime(['2025-04-06 17:00:00', '2025-04-06 17:00:01'], utc=True),
+        'heart_rate': [120, 121],  # not a TrackPoint field
+    })
+    segments = pd.DataFrame({
+        'start_idx': [0], 'end_idx': [1], 'bearing': [45.0], 'distance': [120.0],
+        'duration': [30.0], 'speed': [7.8], 'angle_to_wind': [45.0],
+        'tack': pd.Categorical(['Port'], categories=['Port', 'Starboard']),
+    })
+
+    track = Track.from_dataframes('test', points, segments)
+
+    assert track.points[1] == TrackPoint(latitude=18.46, longitude=-66.03, time=points['time'][1])
+    assert track.points[0].elevation is None
+    assert len(track.points) == 2 and list(track.points)[0].latitude == 18.45
+    pd.testing.assert_frame_equal(track.dataframe[['latitude', 'longitude', 'time']], points.drop(columns='heart_rate'))
+    assert Track('test', list(track.points)).points == track.points
+    segment = track.segments[0]
+    assert segment == TrackSegment.from_dataframe_row(segments.iloc[0])
+    assert segment.tack == 'Port' and segment.is_upwind and segment.points == []
+
+
+def test_track_segments_dataframe_round_trip():
+    segments = [
+        TrackSegment(0, 5, 45.0, 100.0, 20.0, 9.0),
+        TrackSegment(6, 9, 135.0, 80.0, 10.0, 7.0, angle_to_wind=130.0, tack='Port', suspicious=True),
+    ]
+    frame = Track('test', [], segments).segments_dataframe
+
+    assert list(frame.columns) == [
+        'start_idx', 'end_idx', 'bearing', 'distance', 'duration', 'speed', 'angle_to_wind', 'tack', 'suspicious'
+    ]
+    assert frame['angle_to_wind'].isna().tolist() == [True, False]
+    assert frame['suspicious'].tolist() == [False, True]
+    rebuilt = Track.from_dataframes('test', pd.DataFrame({'latitude': [], 'longitude': []}), frame)
+    assert rebuilt.segments[1] == segments[1]
+
+
+def test_track_segment_vmg_follows_field_changes():
+    segment = TrackSegment(0, 5, 45.0, 100.0, 20.0, 10.0, angle_to_wind=60.0)
+    assert abs(segment.vmg - 5.0) < 1e-9
+    assert abs(segment.vmg - 5.0) < 1e-9
+
+    segment.angle_to_wind = 120.0
+    assert abs(segment.vmg - 5.0) < 1e-9
+    segment.speed = 20.0
+    assert abs(segment.vmg - 10.0) < 1e-9
+
+
+def test_track_point_arrays_slice():
+    points = [TrackPoint(18.45 + i * 0.01, -66.04, time=pd.Timestamp('2025-04-06 17:00', tz='UTC') + pd.Timedelta(seconds=i))
+              for i in range(4)]
+    arrays = TrackPointArrays.from_points(points)
+
+    sliced = arrays[1:3]
+
+    assert isinstance(sliced, TrackPointArrays)
+    assert list(sliced) == points[1:3]
+    assert sliced == TrackPointArrays.from_points(points[1:3])
+
+
+def test_track_point_arrays_mixed_timezones():
+    start = pd.Timestamp('2025-04-06 17:00', tz='America/Puerto_Rico')
+    points = [TrackPoint(18.45, -66.04, time=start), TrackPoint(18.46, -66.03, time=start.tz_convert('UTC'))]
+
+    arrays = TrackPointArrays.from_points(points)
+
+    assert str(arrays.tz) == 'America/Puerto_Rico'
+    assert arrays[1].time == start and arrays[0].time.tzinfo == arrays[1].time.tzinfo
+    with pytest.raises(ValueError, match='aware and naive'):
+        TrackPointArrays.from_points([points[0], TrackPoint(18.46, -66.03, time=start.tz_localize(None))])
+
+
+def test_gear_item_from_session_state_stretch_metrics():
+    stretches = pd.DataFrame({
+        'start_idx': [0, 10, 20], 'end_idx': [9, 19, 29], 'bearing': [45.0, 315.0, 180.0],
+        'angle_to_wind': [45.0, 45.0, 180.0], 'tack': ['Port', 'Starboard', 'Port'],
+        'distance': [100.0, 100.0, 100.0], 'speed': [10.0, 12.0, 15.0], 'duration': [20.0, 20.0, 20.0],
+    })
+    item = GearItem.from_session_state('a', {'track_stretches': stretches})
+
+    assert (item.best_port_upwind_angle, item.best_port_downwind_angle) == (45.0, 180.0)
+    assert item.best_starboard_downwind_angle is None
+    assert np.isclose(item.vmg_upwind, 11 * np.cos(np.radians(45)))
+    assert GearItem.from_session_state('b', {'track_stretches': stretches.iloc[:0]}).vmg_upwind is None
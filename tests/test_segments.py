@@ -0,0 +1,180 @@
+"""
+Tests for segment detection and wind angle analysis.
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.segments import (
+    SegmentAnalyzer,
+    SegmentFilterCriteria,
+    analyze_wind_angles,
+    find_consistent_angle_stretches,
+)
+from utils.geo import (
+    calculate_bearing,
+    calculate_bearings,
+    calculate_distance,
+    calculate_distances,
+    calculate_track_hops,
+)
+
+
+def make_track(legs, start=(18.45, -66.04), step_seconds=1.0):
+    """
+    Build a synthetic track from (bearing, speed_m_s, seconds) legs.
+
+    Args:
+        legs: List of (bearing in degrees, speed in m/s, duration in seconds) tuples
+        start: (latitude, longitude) of the first point
+        step_seconds: Time between points
+
+    Returns:
+        DataFrame with latitude, longitude and time columns
+    """
+    lat, lon = start
+    time = pd.Timestamp('2025-04-06 17:00:00', tz='UTC')
+    rows = [{'latitude': lat, 'longitude': lon, 'time': time}]
+    for bearing, speed, seconds in legs:
+        for _ in range(int(seconds / step_seconds)):
+            step = speed * step_seconds
+            lat += step * math.cos(math.radians(bearing)) / 111320.0
+            lon += step * math.sin(math.radians(bearing)) / (111320.0 * math.cos(math.radians(lat)))
+            time += pd.Timedelta(seconds=step_seconds)
+            rows.append({'latitude': lat, 'longitude': lon, 'time': time})
+    return pd.DataFrame(rows)
+
+
+def test_vectorized_geo_matches_scalar():
+    track = make_track([(45, 6, 30), (135, 8, 30), (300, 5, 30)])
+    lat = track['latitude'].to_numpy()
+    lon = track['longitude'].to_numpy()
+
+    bearings = calculate_bearings(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    distances = calculate_distances(lat[:-1], lon[:-1], lat[1:], lon[1:])
+
+    for i in range(len(track) - 1):
+        assert math.isclose(bearings[i], calculate_bearing(lat[i], lon[i], lat[i + 1], lon[i + 1]), abs_tol=1e-9)
+        assert math.isclose(distances[i], calculate_distance(lat[i], lon[i], lat[i + 1], lon[i + 1]), abs_tol=1e-6)
+
+
+def test_track_hops_match_pairwise_functions():
+    track = make_track([(45, 6, 30), (135, 8, 30), (300, 5, 30)])
+    lat = track['latitude'].to_numpy()
+    lon = track['longitude'].to_numpy()
+
+    bearings, distances = calculate_track_hops(lat, lon)
+
+    np.testing.assert_array_equal(bearings, calculate_bearings(lat[:-1], lon[:-1], lat[1:], lon[1:]))
+    np.testing.assert_array_equal(distances, calculate_distances(lat[:-1], lon[:-1], lat[1:], lon[1:]))
+
+
+def test_vectorized_distance_handles_coincident_points():
+    lat = np.array([18.45, 18.45])
+    lon = np.array([-66.04, -66.04])
+    assert np.all(calculate_distances(lat, lon, lat, lon) == 0)
+
+
+
+def test_distance_warns_when_vincenty_does_not_converge(caplog):
+    calculate_distance(18.45, -66.04, 18.46, -66.03)
+    assert not caplog.records
+
+    calculate_distance(0, 0, 0.5, 179.7)
+    assert 'did not converge' in caplog.text
+
+def test_find_consistent_angle_stretches_splits_on_turns():
+    track = make_track([(45, 6, 30), (135, 8, 30), (300, 5, 30)])
+    stretches = find_consistent_angle_stretches(track, 15, 10, 50)
+
+    assert len(stretches) == 3
+    assert list(stretches.columns) == ['start_idx', 'end_idx', 'bearing', 'distance', 'duration', 'speed']
+    np.testing.assert_allclose(stretches['bearing'], [45, 135, 300], atol=1)
+    # 6, 8 and 5 m/s in knots; durations run from the first to the last point of
+    # a stretch while distances include the hop to the next point, hence the tolerance
+    np.testing.assert_allclose(stretches['speed'], [11.66, 15.55, 9.72], rtol=0.05)
+
+
+def test_find_consistent_angle_stretches_applies_minimums():
+    track = make_track([(45, 6, 30), (135, 1, 5), (300, 5, 30)])
+    stretches = find_consistent_angle_stretches(track, 15, 10, 50)
+
+    assert len(stretches) == 2
+    assert (stretches['duration'] >= 10).all()
+    assert (stretches['distance'] >= 50).all()
+
+
+def test_find_consistent_angle_stretches_splits_slow_turns():
+    # 4° per second never exceeds the tolerance between neighbours, but the
+    # bearing drifts away from where each stretch started
+    track = make_track([(heading, 6, 1) for heading in range(0, 120, 4)])
+    stretches = find_consistent_angle_stretches(track, 15, 0, 0)
+
+    assert len(stretches) > 1
+    assert (np.diff(stretches['bearing']) > 15).all()
+
+
+def test_find_consistent_angle_stretches_short_track():
+    track = make_track([])
+    assert find_consistent_angle_stretches(track, 15, 10, 50).empty
+
+
+def test_analyze_wind_angles_classifies_tacks():
+    stretches = pd.DataFrame({'bearing': [45.0, 315.0, 135.0, 225.0], 'distance': 100.0})
+    result = analyze_wind_angles(stretches, 0)
+
+    assert list(result['angle_to_wind']) == [45, 45, 135, 135]
+    assert list(result['tack']) == ['Port', 'Starboard', 'Port', 'Starboard']
+    assert list(result['sailing_type']) == ['Upwind Port', 'Upwind Starboard', 'Downwind Port', 'Downwind Starboard']
+    assert isinstance(result['tack'].dtype, pd.CategoricalDtype)
+    assert isinstance(result['sailing_type'].dtype, pd.CategoricalDtype)
+
+
+def test_analyze_wind_angles_leaves_input_unchanged():
+    stretches = pd.DataFrame({'bearing': [45.0, 315.0], 'distance': 100.0}, index=[3, 8])
+    before = stretches.copy()
+
+    first = analyze_wind_angles(stretches, 0)
+    again = analyze_wind_angles(first, 180)
+
+    pd.testing.assert_frame_equal(stretches, before)
+    assert list(again.columns) == list(first.columns)
+    assert list(again.index) == [3, 8]
+    assert list(again['tack']) == ['Starboard', 'Port']
+
+
+def test_segment_analyzer_leaves_segments_unchanged():
+    segments = pd.DataFrame({
+        'angle_to_wind': [10.0, 45.0, 135.0], 'distance': [200.0, 100.0, 0.0],
+        'speed': [10.0, 20.0, 15.0], 'duration': [30.0, 60.0, 15.0],
+    })
+    before = segments.copy()
+    analyzer = SegmentAnalyzer(segments)
+
+    scored = analyzer.calculate_quality_scores()
+    flagged = analyzer.detect_suspicious_segments(angle_threshold=20)
+    filtered = analyzer.filter_segments(SegmentFilterCriteria(min_angle_to_wind=20, min_distance=50))
+
+    pd.testing.assert_frame_equal(segments, before)
+    np.testing.assert_allclose(scored['quality_score'], [0.75, 0.75, 0.275])
+    assert flagged['suspicious'].tolist() == [True, False, False]
+    assert filtered.index.tolist() == [1]
+
+
+def test_segment_analyzer_groups_follow_segments():
+    segments = analyze_wind_angles(pd.DataFrame({'bearing': [45.0, 315.0, 135.0], 'distance': 100.0}), 0)
+    analyzer = SegmentAnalyzer(segments)
+
+    groups = analyzer.calculate_segment_groups()
+    assert groups['port_upwind'].index.tolist() == [0]
+    assert analyzer.calculate_segment_groups()['port'] is groups['port']
+    assert analyzer.analyze_tack_balance()['port_count'] == 2
+
+    analyzer.segments = segments.iloc[1:]
+    assert analyzer.calculate_segment_groups()['port'].index.tolist() == [2]
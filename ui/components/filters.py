@@ -118,6 +118,19 @@ def segment_selection_bar(
     
     return filtered_segments, st.session_state.filter_changes
 
+@st.cache_data(show_spinner=False)
+def _to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to CSV bytes, cached on its content.
+    
+    Args:
+        df: DataFrame to export
+        
+    Returns:
+        bytes: UTF-8 encoded CSV without the index
+    """
+    return df.to_csv(index=False).encode('utf-8')
+
 def segment_details_table(display_df: pd.DataFrame, selected_segments: List[int]) -> None:
     """
     Display a table with segment details.
@@ -141,11 +154,10 @@ def segment_details_table(display_df: pd.DataFrame, selected_segments: List[int]
     # Download buttons section
     cols = st.columns([1, 1])
     with cols[0]:
-        # Compact download buttons
-        csv = filtered_display_df.to_csv(index=False)
+        # Compact download buttons - CSV is only rebuilt when the segments change
         st.download_button(
             "📥 Download Selected Segments (CSV)",
-            data=csv,
+            data=_to_csv(filtered_display_df),
             file_name="wingfoil_segments.csv",
             mime="text/csv",
             use_container_width=True
@@ -153,10 +165,9 @@ def segment_details_table(display_df: pd.DataFrame, selected_segments: List[int]
     
     with cols[1]:
         # Full data export
-        all_data_csv = display_df.to_csv(index=False)
         st.download_button(
             "📊 Download Complete Analysis",
-            data=all_data_csv,
+            data=_to_csv(display_df),
             file_name="wingfoil_full_analysis.csv",
             mime="text/csv",
             use_container_width=True
@@ -170,14 +181,16 @@ def segment_details_table(display_df: pd.DataFrame, selected_segments: List[int]
     ]
     
     if not filtered_display_df.empty:
-        # Create suspicious indicator
+        table_df = filtered_display_df[display_cols]
+        
+        # Create suspicious indicator (assign returns a new frame, leaving display_df untouched)
         if 'suspicious' in filtered_display_df.columns:
-            filtered_display_df['sailing_type'] = filtered_display_df.apply(
-                lambda row: f"{row['sailing_type']} ⚠️" if row['suspicious'] else row['sailing_type'], 
-                axis=1
+            sailing_type = filtered_display_df['sailing_type'].astype(str)
+            table_df = table_df.assign(
+                sailing_type=sailing_type.where(~filtered_display_df['suspicious'], sailing_type + " ⚠️")
             )
         
-        st.dataframe(filtered_display_df[display_cols], use_container_width=True, height=200)
+        st.dataframe(table_df, use_container_width=True, height=200)
     else:
         st.warning("No segments selected. Please use the filters to select segments.")
 
@@ -8,8 +8,8 @@ and wind analysis.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import folium
 from folium.plugins import MarkerCluster
 from streamlit_folium import folium_static
@@ -22,7 +22,8 @@ def display_track_map(
     gpx_data: pd.DataFrame,
     stretches: pd.DataFrame,
     wind_direction: float,
-    estimated_wind: Optional[float] = None
+    estimated_wind: Optional[float] = None,
+    cache_key: Optional[Tuple] = None
 ) -> None:
     """
     Display a map of the track with colored segments based on wind angles.
@@ -32,129 +33,162 @@ def display_track_map(
         stretches: DataFrame with sailing segments
         wind_direction: Wind direction in degrees
         estimated_wind: Estimated wind direction (if available)
+        cache_key: Optional hashable key identifying the map inputs. When it matches
+            the key of the last map built in this session, that map is reused
+            instead of being rebuilt.
     """
     if gpx_data.empty:
         st.warning("No track data to display")
         return
 
     try:
-        # Create a base map centered on the track
-        mean_lat = gpx_data['latitude'].mean()
-        mean_lon = gpx_data['longitude'].mean()
-        
-        # Find the bounding box to determine best zoom level
-        min_lat, max_lat = gpx_data['latitude'].min(), gpx_data['latitude'].max()
-        min_lon, max_lon = gpx_data['longitude'].min(), gpx_data['longitude'].max()
-        
-        # Create the map with auto zoom
-        m = folium.Map(location=[mean_lat, mean_lon])
-        
-        # Fit bounds to the track data
-        m.fit_bounds([[min_lat, min_lon], [max_lat, max_lon]])
+        if cache_key is not None and st.session_state.get('track_map_key') == cache_key:
+            m = st.session_state.track_map
+        else:
+            m = _build_track_map(gpx_data, stretches, wind_direction, estimated_wind)
+            if cache_key is not None:
+                st.session_state.track_map = m
+                st.session_state.track_map_key = cache_key
         
-        # Add the full track as a gray line
-        track_points = gpx_data[['latitude', 'longitude']].values.tolist()
-        folium.PolyLine(
-            track_points,
-            color='gray',
-            weight=2,
-            opacity=0.7,
-            tooltip='Full track'
-        ).add_to(m)
+        # Display the map
+        folium_static(m, width=800)
         
-        # Add markers for start and end
-        folium.Marker(
-            track_points[0],
-            icon=folium.Icon(color='green', icon='play', prefix='fa'),
-            tooltip='Start'
-        ).add_to(m)
+    except Exception as e:
+        logger.error(f"Error displaying track map: {e}")
+        st.error(f"Error displaying map: {e}")
+
+def _build_track_map(
+    gpx_data: pd.DataFrame,
+    stretches: pd.DataFrame,
+    wind_direction: float,
+    estimated_wind: Optional[float] = None
+) -> folium.Map:
+    """
+    Build the folium map with the track, colored segments and wind arrow.
+    
+    Args:
+        gpx_data: DataFrame with track data
+        stretches: DataFrame with sailing segments
+        wind_direction: Wind direction in degrees
+        estimated_wind: Estimated wind direction (if available)
         
-        folium.Marker(
-            track_points[-1],
-            icon=folium.Icon(color='red', icon='stop', prefix='fa'),
-            tooltip='End'
-        ).add_to(m)
+    Returns:
+        folium.Map: The assembled map
+    """
+    # Create a base map centered on the track
+    mean_lat = gpx_data['latitude'].mean()
+    mean_lon = gpx_data['longitude'].mean()
+    
+    # Find the bounding box to determine best zoom level
+    min_lat, max_lat = gpx_data['latitude'].min(), gpx_data['latitude'].max()
+    min_lon, max_lon = gpx_data['longitude'].min(), gpx_data['longitude'].max()
+    
+    # Create the map with auto zoom
+    m = folium.Map(location=[mean_lat, mean_lon])
+    
+    # Fit bounds to the track data
+    m.fit_bounds([[min_lat, min_lon], [max_lat, max_lon]])
+    
+    # Add the full track as a gray line
+    track_points = gpx_data[['latitude', 'longitude']].values.tolist()
+    folium.PolyLine(
+        track_points,
+        color='gray',
+        weight=2,
+        opacity=0.7,
+        tooltip='Full track'
+    ).add_to(m)
+    
+    # Add markers for start and end
+    folium.Marker(
+        track_points[0],
+        icon=folium.Icon(color='green', icon='play', prefix='fa'),
+        tooltip='Start'
+    ).add_to(m)
+    
+    folium.Marker(
+        track_points[-1],
+        icon=folium.Icon(color='red', icon='stop', prefix='fa'),
+        tooltip='End'
+    ).add_to(m)
+    
+    # Add colored segments based on wind angles if available
+    if not stretches.empty and 'sailing_type' in stretches.columns:
+        # Define colors for different sailing types
+        colors = {
+            'Upwind Port': 'blue',
+            'Upwind Starboard': 'purple',
+            'Downwind Port': 'orange',
+            'Downwind Starboard': 'red'
+        }
         
-        # Add colored segments based on wind angles if available
-        if not stretches.empty and 'sailing_type' in stretches.columns:
-            # Define colors for different sailing types
-            colors = {
-                'Upwind Port': 'blue',
-                'Upwind Starboard': 'purple',
-                'Downwind Port': 'orange',
-                'Downwind Starboard': 'red'
-            }
+        # Group segments by sailing type in one pass over the categorical codes
+        for sailing_type, type_segments in stretches.groupby('sailing_type', observed=True, sort=False):
+            color = colors.get(sailing_type)
+            if color is None:
+                continue
             
-            # Group segments by sailing type
-            for sailing_type, color in colors.items():
-                type_segments = stretches[stretches['sailing_type'] == sailing_type]
+            # Add each segment as a colored line
+            for _, segment in type_segments.iterrows():
+                start_idx = int(segment['start_idx'])
+                end_idx = int(segment['end_idx'])
+                segment_points = gpx_data.iloc[start_idx:end_idx+1][['latitude', 'longitude']].values.tolist()
                 
-                # Add each segment as a colored line
-                for _, segment in type_segments.iterrows():
-                    start_idx = int(segment['start_idx'])
-                    end_idx = int(segment['end_idx'])
-                    segment_points = gpx_data.iloc[start_idx:end_idx+1][['latitude', 'longitude']].values.tolist()
+                # Add the segment line
+                if len(segment_points) >= 2:
+                    # Create more informative tooltip that emphasizes angle off wind
+                    tooltip_text = (
+                        f"{sailing_type}<br>"
+                        f"<b>Angle off wind:</b> {segment['angle_to_wind']:.1f}°<br>"
+                        f"<b>Speed:</b> {segment['speed']:.1f} knots<br>"
+                        f"<small>Heading: {segment['bearing']:.1f}°</small>"
+                    )
                     
-                    # Add the segment line
-                    if len(segment_points) >= 2:
-                        # Create more informative tooltip that emphasizes angle off wind
-                        tooltip_text = (
-                            f"{sailing_type}<br>"
-                            f"<b>Angle off wind:</b> {segment['angle_to_wind']:.1f}°<br>"
-                            f"<b>Speed:</b> {segment['speed']:.1f} knots<br>"
-                            f"<small>Heading: {segment['bearing']:.1f}°</small>"
-                        )
-                        
-                        folium.PolyLine(
-                            segment_points,
-                            color=color,
-                            weight=4,
-                            opacity=0.8,
-                            tooltip=tooltip_text
-                        ).add_to(m)
+                    folium.PolyLine(
+                        segment_points,
+                        color=color,
+                        weight=4,
+                        opacity=0.8,
+                        tooltip=tooltip_text
+                    ).add_to(m)
+    
+    # Add wind direction arrow
+    if wind_direction is not None:
+        # Calculate arrow endpoint
+        arrow_length = 0.003  # Arrow length in degrees
+        arrow_lat = mean_lat
+        arrow_lon = mean_lon
         
-        # Add wind direction arrow
-        if wind_direction is not None:
-            # Calculate arrow endpoint
-            arrow_length = 0.003  # Arrow length in degrees
-            arrow_lat = mean_lat
-            arrow_lon = mean_lon
-            
-            # Calculate endpoint based on wind direction
-            end_lat = arrow_lat + arrow_length * np.cos(np.radians(wind_direction))
-            end_lon = arrow_lon + arrow_length * np.sin(np.radians(wind_direction))
-            
-            # Add wind direction arrow
-            folium.PolyLine(
-                [(arrow_lat, arrow_lon), (end_lat, end_lon)],
-                color='black',
-                weight=3,
-                opacity=0.9,
-                tooltip=f"Wind direction: {wind_direction:.1f}°",
-                arrow_head=10
-            ).add_to(m)
-            
-            # Add marker with wind info
-            wind_info = f"Wind: {wind_direction:.1f}°"
-            if estimated_wind is not None and abs(estimated_wind - wind_direction) > 5:
-                wind_info += f" (Estimated: {estimated_wind:.1f}°)"
-                
-            folium.Marker(
-                [arrow_lat, arrow_lon],
-                icon=folium.DivIcon(
-                    icon_size=(150, 36),
-                    icon_anchor=(75, 18),
-                    html=f'<div style="font-size: 12pt; color: var(--text-color, black); background-color: var(--secondary-background-color, rgba(255,255,255,0.7)); '
-                         f'padding: 3px; border-radius: 3px;">{wind_info}</div>'
-                )
-            ).add_to(m)
+        # Calculate endpoint based on wind direction
+        end_lat = arrow_lat + arrow_length * np.cos(np.radians(wind_direction))
+        end_lon = arrow_lon + arrow_length * np.sin(np.radians(wind_direction))
         
-        # Display the map
-        folium_static(m, width=800)
+        # Add wind direction arrow
+        folium.PolyLine(
+            [(arrow_lat, arrow_lon), (end_lat, end_lon)],
+            color='black',
+            weight=3,
+            opacity=0.9,
+            tooltip=f"Wind direction: {wind_direction:.1f}°",
+            arrow_head=10
+        ).add_to(m)
         
-    except Exception as e:
-        logger.error(f"Error displaying track map: {e}")
-        st.error(f"Error displaying map: {e}")
+        # Add marker with wind info
+        wind_info = f"Wind: {wind_direction:.1f}°"
+        if estimated_wind is not None and abs(estimated_wind - wind_direction) > 5:
+            wind_info += f" (Estimated: {estimated_wind:.1f}°)"
+            
+        folium.Marker(
+            [arrow_lat, arrow_lon],
+            icon=folium.DivIcon(
+                icon_size=(150, 36),
+                icon_anchor=(75, 18),
+                html=f'<div style="font-size: 12pt; color: var(--text-color, black); background-color: var(--secondary-background-color, rgba(255,255,255,0.7)); '
+                     f'padding: 3px; border-radius: 3px;">{wind_info}</div>'
+            )
+        ).add_to(m)
+    
+    return m
 
 def plot_polar_diagram(stretches: pd.DataFrame, wind_direction: float) -> Figure:
     """
@@ -167,20 +201,23 @@ def plot_polar_diagram(stretches: pd.DataFrame, wind_direction: float) -> Figure
     Returns:
         Figure: Matplotlib figure with the polar plot
     """
-    # Create figure
-    fig = plt.figure(figsize=(8, 8))
+    # Create figure outside pyplot's global registry so it is freed once unreferenced
+    fig = Figure(figsize=(8, 8))
     ax = fig.add_subplot(111, projection='polar')
     
-    # Get port and starboard data to ensure proper positioning
-    port_mask = stretches['tack'] == 'Port'
-    starboard_mask = stretches['tack'] == 'Starboard'
+    # Tack and upwind masks are computed once and reused for all selections below
+    port_mask = (stretches['tack'] == 'Port').to_numpy()
+    starboard_mask = (stretches['tack'] == 'Starboard').to_numpy()
+    upwind_mask = (stretches['angle_to_wind'] < 90).to_numpy()
+    angles_rad = np.radians(stretches['angle_to_wind'].to_numpy())
+    speeds = stretches['speed'].to_numpy()
     
     # Prepare plotting data for port and starboard, placing them on opposite sides
-    port_angles_rad = np.radians(stretches.loc[port_mask, 'angle_to_wind'].values)
-    port_speeds = stretches.loc[port_mask, 'speed'].values
+    port_angles_rad = angles_rad[port_mask]
+    port_speeds = speeds[port_mask]
     
-    starboard_angles_rad = np.radians(stretches.loc[starboard_mask, 'angle_to_wind'].values)
-    starboard_speeds = stretches.loc[starboard_mask, 'speed'].values
+    starboard_angles_rad = angles_rad[starboard_mask]
+    starboard_speeds = speeds[starboard_mask]
     
     # Set plot parameters
     ax.set_theta_zero_location("N")  # 0 is at the top
@@ -190,19 +227,8 @@ def plot_polar_diagram(stretches: pd.DataFrame, wind_direction: float) -> Figure
     max_speed = max(stretches['speed'].max() if not stretches.empty else 20, 20)
     
     # Plot segments as points with different colors for port and starboard
-    port_colors = []
-    for sailing_type in stretches.loc[port_mask, 'sailing_type']:
-        if 'Upwind' in sailing_type:
-            port_colors.append('blue')
-        else:
-            port_colors.append('orange')
-            
-    starboard_colors = []
-    for sailing_type in stretches.loc[starboard_mask, 'sailing_type']:
-        if 'Upwind' in sailing_type:
-            starboard_colors.append('purple')
-        else:
-            starboard_colors.append('red')
+    port_colors = np.where(upwind_mask[port_mask], 'blue', 'orange')
+    starboard_colors = np.where(upwind_mask[starboard_mask], 'purple', 'red')
     
     # Scatter plot of port tack points
     if len(port_angles_rad) > 0:
@@ -225,10 +251,10 @@ def plot_polar_diagram(stretches: pd.DataFrame, wind_direction: float) -> Figure
     
     # Add legend
     legend_elements = [
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', markersize=10, label='Upwind Port'),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='purple', markersize=10, label='Upwind Starboard'),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='orange', markersize=10, label='Downwind Port'),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='red', markersize=10, label='Downwind Starboard')
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', markersize=10, label='Upwind Port'),
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='purple', markersize=10, label='Upwind Starboard'),
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='orange', markersize=10, label='Downwind Port'),
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='red', markersize=10, label='Downwind Starboard')
     ]
     ax.legend(handles=legend_elements, loc='lower right', bbox_to_anchor=(0.95, -0.05))
     
@@ -245,5 +271,5 @@ def plot_polar_diagram(stretches: pd.DataFrame, wind_direction: float) -> Figure
     ax.set_thetamin(0)
     ax.set_thetamax(180)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
\ No newline at end of file
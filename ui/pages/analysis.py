@@ -8,6 +8,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import logging
+import io
+import html
+import hashlib
 from datetime import timedelta
 
 # Import from core modules
@@ -23,11 +26,12 @@ from core.metrics_advanced import (
     estimate_wind_direction_weighted
 )
 
-# Import UI components
-from ui.components.visualization import display_track_map, plot_polar_diagram
+# Import UI components (ui.components.visualization pulls in matplotlib and folium,
+# so it is imported where a map or plot is actually rendered)
 from ui.components.filters import segment_selection_bar, segment_details_table, segment_selection_checkboxes
 from ui.components.wind_ui import wind_direction_selector, reestimate_wind_button
 from ui.components.gear_export import export_to_comparison_button
+from services.segment_service import SegmentDetectionParams, DISPLAY_ROUNDING
 
 # Import config settings
 from config.settings import (
@@ -36,15 +40,215 @@ from config.settings import (
     DEFAULT_MIN_DISTANCE,
     DEFAULT_MIN_SPEED,
     DEFAULT_SUSPICIOUS_ANGLE_THRESHOLD,
-    DEFAULT_WIND_DIRECTION
+    DEFAULT_WIND_DIRECTION,
+    DEFAULT_MIN_SEGMENT_DISTANCE,
+    DEFAULT_VMG_ANGLE_RANGE
 )
 
-# Advanced algorithm configuration
-DEFAULT_MIN_SEGMENT_DISTANCE = 50  # Minimum segment distance for algorithms in meters
-DEFAULT_VMG_ANGLE_RANGE = 20       # Range around best angle to include for VMG calculation
-
 logger = logging.getLogger(__name__)
 
+def _frame_key(df):
+    """
+    Content hash of a DataFrame, used as a cheap cache key for derived artefacts.
+    
+    Args:
+        df: DataFrame to fingerprint
+        
+    Returns:
+        int: Hash of the index and values
+    """
+    return int(pd.util.hash_pandas_object(df).sum())
+
+def _track_key(file_bytes):
+    """
+    Stable digest of an uploaded GPX file, used to key the cached pipeline.
+    
+    Args:
+        file_bytes: Raw GPX file content
+        
+    Returns:
+        str: Hex digest of the content
+    """
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+def _current_track_key():
+    """
+    Digest identifying the track in session state.
+    
+    Falls back to a content hash of the track frame (computed once and stored)
+    when the track was put into session state without an upload digest.
+    
+    Returns:
+        str: Key for the cached per-track helpers
+    """
+    if st.session_state.get('track_key') is None:
+        st.session_state.track_key = f"frame-{_frame_key(st.session_state.track_data)}"
+    return st.session_state.track_key
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_polar_diagram(stretches_key, wind_direction, _stretches):
+    """
+    Build the polar diagram once per segment set and wind direction.
+    
+    Args:
+        stretches_key: Content hash of the stretches (see _frame_key)
+        wind_direction: Wind direction in degrees
+        _stretches: The stretches to plot (not hashed; identified by stretches_key)
+        
+    Returns:
+        Figure: Matplotlib figure with the polar plot
+    """
+    from ui.components.visualization import plot_polar_diagram
+    return plot_polar_diagram(_stretches, wind_direction)
+
+@st.cache_data(show_spinner=False)
+def _load_gpx_bytes(track_key, file_name, _file_bytes):
+    """
+    Parse uploaded GPX content, cached on its digest.
+    
+    Args:
+        track_key: Digest of the file content (see _track_key)
+        file_name: Original file name, used as a fallback track name
+        _file_bytes: Raw GPX file content (not hashed; identified by track_key)
+        
+    Returns:
+        tuple: (DataFrame with track data, dict with metadata)
+    """
+    gpx_file = io.BytesIO(_file_bytes)
+    gpx_file.name = file_name
+    return load_gpx_file(gpx_file)
+
+@st.cache_data(show_spinner=False)
+def _cached_metrics(track_key, active_speed_threshold, _track_data):
+    """
+    Calculate track metrics together with ready-to-render display strings.
+    
+    Cached per track and active speed threshold, so reruns only look up the
+    formatted values instead of redoing the arithmetic and string building.
+    
+    Args:
+        track_key: Digest identifying the track
+        active_speed_threshold: Minimum speed in knots counted as active sailing
+        _track_data: DataFrame with GPX track points (not hashed; identified by track_key)
+        
+    Returns:
+        dict: Track metrics plus *_display fields for the summary card
+    """
+    metrics = calculate_track_metrics(_track_data, min_speed_knots=active_speed_threshold)
+    
+    if 'duration' in metrics:
+        metrics['duration_display'] = f"{metrics['duration'].total_seconds() / 60:.0f} min"
+        
+        if 'active_duration' in metrics:
+            active_seconds = metrics['active_duration'].total_seconds()
+            total_seconds = metrics['total_duration_seconds']
+            active_percent = (active_seconds / total_seconds) * 100 if total_seconds > 0 else 0
+            metrics['active_duration_display'] = f"Active: {active_seconds / 60:.0f} min ({active_percent:.0f}%)"
+    
+    if 'distance' in metrics:
+        metrics['distance_display'] = f"{metrics['distance']:.2f} km"
+    
+    if 'weighted_avg_speed' in metrics:
+        metrics['weighted_avg_speed_display'] = f"{metrics['weighted_avg_speed']:.1f} kn"
+        metrics['active_threshold_display'] = f"Above {active_speed_threshold} knots"
+        
+        # Only show the overall average when it differs noticeably
+        if 'overall_avg_speed' in metrics and abs(metrics['overall_avg_speed'] - metrics['weighted_avg_speed']) > 0.1:
+            metrics['overall_avg_speed_display'] = f"Overall avg: {metrics['overall_avg_speed']:.1f} knots (with stops)"
+    elif 'avg_speed' in metrics:
+        metrics['avg_speed_display'] = f"{metrics['avg_speed']:.1f} kn"
+    
+    return metrics
+
+@st.cache_data(show_spinner=False)
+def _detect_stretches(track_key, angle_tolerance, min_duration, min_distance, min_speed, _track_data):
+    """
+    Detect consistent angle stretches and keep those at or above the minimum speed.
+    
+    Results are cached per track and detection setting, so reruns that only change
+    the wind direction, the suspicious angle threshold or unrelated widgets skip
+    segment detection and filtering.
+    
+    Args:
+        track_key: Digest identifying the track
+        angle_tolerance: Maximum bearing variation within a stretch, in degrees
+        min_duration: Minimum stretch duration in seconds
+        min_distance: Minimum stretch distance in meters
+        min_speed: Minimum stretch speed in knots
+        _track_data: DataFrame with GPX track points (not hashed; identified by track_key)
+        
+    Returns:
+        DataFrame: Stretches meeting all criteria
+    """
+    stretches = find_consistent_angle_stretches(
+        _track_data, angle_tolerance, min_duration, min_distance
+    )
+    
+    if not stretches.empty:
+        logger.info(f"Filtering {len(stretches)} stretches by min_speed: {min_speed} knots")
+        
+        # stretches['speed'] is already in knots
+        stretches = stretches[stretches['speed'] >= min_speed]
+        logger.info(f"After filtering: {len(stretches)} stretches remain")
+    
+    return stretches
+
+@st.cache_data(show_spinner=False)
+def _analyze_wind(stretches, wind_direction):
+    """
+    Add wind angle, tack and sailing type columns, cached per segment set and wind direction.
+    
+    Args:
+        stretches: DataFrame with detected stretches
+        wind_direction: Wind direction in degrees
+        
+    Returns:
+        DataFrame: Stretches with wind angle information
+    """
+    return analyze_wind_angles(stretches, wind_direction)
+
+@st.cache_data(show_spinner=False)
+def _estimate_wind(stretches, user_wind_direction, suspicious_angle_threshold, min_segment_distance):
+    """
+    Refine the user's wind direction from the detected stretches.
+    
+    Cached so that reruns with the same track, starting direction and thresholds
+    return the stored estimate instead of repeating the weighted estimation.
+    
+    Args:
+        stretches: DataFrame with detected stretches
+        user_wind_direction: Wind direction provided by the user in degrees
+        suspicious_angle_threshold: Angles below this are excluded from the estimate
+        min_segment_distance: Minimum segment distance in meters
+        
+    Returns:
+        WindEstimate: Wind direction estimate with metadata
+    """
+    analyzed_stretches = analyze_wind_angles(stretches, user_wind_direction)
+    return estimate_wind_direction_weighted(
+        analyzed_stretches,
+        user_wind_direction,
+        suspicious_angle_threshold=suspicious_angle_threshold,
+        min_segment_distance=min_segment_distance
+    )
+
+def _current_segment_params():
+    """
+    Collect the segment detection parameters from session state.
+    
+    Returns:
+        SegmentDetectionParams: Current parameters, falling back to defaults
+    """
+    return SegmentDetectionParams(
+        angle_tolerance=st.session_state.get('angle_tolerance', DEFAULT_ANGLE_TOLERANCE),
+        min_duration=st.session_state.get('min_duration', DEFAULT_MIN_DURATION),
+        min_distance=st.session_state.get('min_distance', DEFAULT_MIN_DISTANCE),
+        min_speed=st.session_state.get('min_speed', DEFAULT_MIN_SPEED),
+        suspicious_angle_threshold=st.session_state.get(
+            'suspicious_angle_threshold', DEFAULT_SUSPICIOUS_ANGLE_THRESHOLD
+        )
+    )
+
 def recalculate_segments(params_changed=None):
     """
     Central function to recalculate segments with current parameters.
@@ -61,34 +265,22 @@ def recalculate_segments(params_changed=None):
     
     try:
         # Get parameters from session state or use defaults
-        angle_tolerance = st.session_state.get('angle_tolerance', DEFAULT_ANGLE_TOLERANCE)
-        min_duration = st.session_state.get('min_duration', DEFAULT_MIN_DURATION)
-        min_distance = st.session_state.get('min_distance', DEFAULT_MIN_DISTANCE)
-        min_speed = st.session_state.get('min_speed', DEFAULT_MIN_SPEED)
+        params = _current_segment_params()
         wind_direction = st.session_state.get('wind_direction', DEFAULT_WIND_DIRECTION)
         
         logger.info(f"Recalculating segments: {params_changed or 'all parameters'} changed")
-        logger.info(f"Using parameters: angle_tolerance={angle_tolerance}°, min_duration={min_duration}s, "
-                   f"min_distance={min_distance}m, min_speed={min_speed}kn, wind_direction={wind_direction}°")
-        
-        # Re-detect stretches from raw data
-        base_stretches = find_consistent_angle_stretches(
-            st.session_state.track_data, 
-            angle_tolerance, 
-            min_duration, 
-            min_distance
+        logger.info(f"Using parameters: angle_tolerance={params.angle_tolerance}°, min_duration={params.min_duration}s, "
+                   f"min_distance={params.min_distance}m, min_speed={params.min_speed}kn, wind_direction={wind_direction}°")
+        
+        # Re-detect stretches from raw data (cached per track and detection setting)
+        base_stretches = _detect_stretches(
+            _current_track_key(), params.angle_tolerance, params.min_duration,
+            params.min_distance, params.min_speed, st.session_state.track_data
         )
         
-        # Filter by minimum speed
         if not base_stretches.empty:
-            logger.info(f"Filtering {len(base_stretches)} stretches by min_speed: {min_speed} knots")
-            
-            # Filter by speed in knots directly - stretches['speed'] is already in knots
-            base_stretches = base_stretches[base_stretches['speed'] >= min_speed]
-            logger.info(f"After filtering: {len(base_stretches)} stretches remain")
-            
             # Analyze with current wind direction
-            recalculated = analyze_wind_angles(base_stretches, wind_direction)
+            recalculated = _analyze_wind(base_stretches, wind_direction)
             
             # Update session state
             st.session_state.track_stretches = recalculated
@@ -141,6 +333,151 @@ def update_wind_direction(new_wind_direction, recalculate_stretches=True):
         logger.error(f"Error updating existing stretches: {e}")
         return False
 
+def _best_angle_segments(stretches):
+    """
+    Find the best upwind and downwind segment on each tack.
+    
+    Upwind segments (angle to wind < 90°) are ranked by the smallest angle,
+    downwind segments by the largest. Works on plain NumPy columns and returns
+    scalars, so no pandas rows are materialized.
+    
+    Args:
+        stretches: DataFrame with angle_to_wind, speed, bearing and tack columns
+        
+    Returns:
+        dict: Maps (wind_side, tack) tuples such as ('up', 'Port') to a dict with
+            the angle_to_wind, speed and bearing of the best segment
+    """
+    angles = stretches['angle_to_wind'].to_numpy(dtype=float)
+    speeds = stretches['speed'].to_numpy(dtype=float)
+    bearings = stretches['bearing'].to_numpy(dtype=float)
+    tacks = stretches['tack'].to_numpy()
+    is_upwind = angles < 90
+    # Negate upwind angles so one argmax picks the smallest upwind and the
+    # largest downwind angle
+    rank_key = np.where(is_upwind, -angles, angles)
+    
+    best = {}
+    for side, side_mask in (('up', is_upwind), ('down', ~is_upwind)):
+        for tack in ('Port', 'Starboard'):
+            positions = np.flatnonzero(side_mask & (tacks == tack))
+            if positions.size == 0:
+                continue
+            pick = positions[rank_key[positions].argmax()]
+            best[(side, tack)] = {
+                'angle_to_wind': angles[pick],
+                'speed': speeds[pick],
+                'bearing': bearings[pick]
+            }
+    return best
+
+def _best_angle_metric_rows(best_angles, side):
+    """
+    Build the metric records for the best segment on each tack.
+    
+    Args:
+        best_angles: Result of _best_angle_segments
+        side: 'up' or 'down'
+        
+    Returns:
+        list: Dicts with label, value, delta and caption, port tack first
+    """
+    rows = []
+    for tack in ('Port', 'Starboard'):
+        best = best_angles.get((side, tack))
+        if best is not None:
+            rows.append({
+                'label': f"Best {tack} Angle",
+                'value': f"{best['angle_to_wind']:.1f}°",
+                'delta': f"{best['speed']:.1f} knots",
+                'caption': f"Bearing: {best['bearing']:.0f}°"
+            })
+    return rows
+
+def _render_metric_rows(rows):
+    """
+    Render prepared metric records, each as a metric with a caption underneath.
+    
+    Args:
+        rows: List of dicts with label, value, delta and caption
+    """
+    with st.container():
+        for row in rows:
+            st.metric(row['label'], row['value'], row['delta'])
+            st.caption(row['caption'])
+
+@st.fragment
+def _wind_direction_panel(current_wind, estimated_wind, current_file):
+    """
+    Render the wind direction selector as a fragment.
+    
+    Editing the direction only reruns this panel; the rest of the page (and
+    the wind-dependent analysis) is refreshed once the change is applied.
+    
+    Args:
+        current_wind: Current wind direction in degrees
+        estimated_wind: Estimated session wind direction, if available
+        current_file: Name of the loaded file, used to remember its wind settings
+    """
+    def on_wind_change(new_wind_direction):
+        if update_wind_direction(new_wind_direction):
+            # Update this file's settings in our persistent dictionary
+            if current_file:
+                if current_file not in st.session_state.file_wind_settings:
+                    st.session_state.file_wind_settings[current_file] = {}
+                st.session_state.file_wind_settings[current_file]['wind_direction'] = new_wind_direction
+            
+            st.success(f"Wind direction updated to {new_wind_direction}°")
+            st.rerun()  # Full app rerun to refresh everything with the new angles
+    
+    wind_direction_selector(
+        current_wind=current_wind,
+        estimated_wind=estimated_wind,
+        on_change_callback=on_wind_change
+    )
+
+def _track_summary_html(track_name, metrics):
+    """
+    Build the track summary card as a single HTML grid.
+    
+    Args:
+        track_name: Name of the track
+        metrics: Track metrics from _cached_metrics, including the *_display fields
+        
+    Returns:
+        str: HTML for the summary card
+    """
+    value_style = "font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);"
+    note_style = "font-size:0.85rem; color:var(--text-color, #666);"
+    
+    cells = [
+        f"<strong>🏄 {html.escape(str(track_name))}</strong><br/>"
+        f"📅 <strong>Date:</strong> {metrics.get('date', 'Unknown')}"
+    ]
+    
+    if 'duration_display' in metrics:
+        cell = f"⏱️ <strong>Duration</strong><br/><span class='card-metric' style='{value_style}'>{metrics['duration_display']}</span>"
+        if 'active_duration_display' in metrics:
+            cell += f"<br/><span style='{note_style}'>{metrics['active_duration_display']}</span>"
+        cells.append(cell)
+    
+    if 'distance_display' in metrics:
+        cells.append(f"📏 <strong>Distance</strong><br/><span class='card-metric' style='{value_style}'>{metrics['distance_display']}</span>")
+    
+    if 'weighted_avg_speed_display' in metrics:
+        cell = (f"⚡ <strong>Average Speed</strong><br/><span class='card-metric' style='{value_style}'>{metrics['weighted_avg_speed_display']}</span>"
+                f"<br/><span style='{note_style}'>{metrics['active_threshold_display']}</span>")
+        # Show comparison if different
+        if 'overall_avg_speed_display' in metrics:
+            cell += f"<br/><span style='{note_style}'>{metrics['overall_avg_speed_display']}</span>"
+        cells.append(cell)
+    elif 'avg_speed_display' in metrics:
+        cells.append(f"⚡ <strong>Average Speed</strong><br/><span class='card-metric' style='{value_style}'>{metrics['avg_speed_display']}</span>")
+    
+    return ("<div style='display:grid; grid-template-columns:repeat(auto-fit, minmax(160px, 1fr)); gap:1rem;'>"
+            + "".join(f"<div>{cell}</div>" for cell in cells)
+            + "</div>")
+
 def display_page():
     """Display the track analysis page."""
     st.header("Track Analysis")
@@ -222,8 +559,6 @@ def display_page():
         if active_speed_threshold != prev_active_speed_threshold:
             st.session_state.active_speed_threshold = active_speed_threshold
             # This one doesn't need to trigger a full segment recalculation, only metrics
-
-        min_speed_ms = min_speed * 0.514444  # Convert knots to m/s
         
         # Technical parameter - but important for accurate analysis
         # Default to 20 degrees - below this is usually not physically possible
@@ -241,6 +576,15 @@ def display_page():
         if suspicious_angle_threshold != prev_suspicious_angle_threshold:
             st.session_state.suspicious_angle_threshold = suspicious_angle_threshold
             on_param_change()
+        
+        # All detection parameters as one hashable value for the cached pipeline
+        segment_params = SegmentDetectionParams(
+            angle_tolerance=angle_tolerance,
+            min_duration=min_duration,
+            min_distance=min_distance,
+            min_speed=min_speed,
+            suspicious_angle_threshold=suspicious_angle_threshold
+        )
             
         # Add a button to manually recalculate all segments if needed
         if st.button("🔄 Recalculate All Segments", 
@@ -344,6 +688,9 @@ def display_page():
             st.session_state.estimated_wind = None
             st.session_state.current_file_name = None
             st.session_state.analyze_confirmed = False
+            st.session_state.track_map = None
+            st.session_state.track_map_key = None
+            st.session_state.track_key = None
             st.rerun()
     
     # Wind direction adjustment section - only shown after a file is loaded
@@ -369,24 +716,8 @@ def display_page():
                 'estimated_wind': estimated_wind
             }
         
-        # Use the wind direction selector component
-        def on_wind_change(new_wind_direction):
-            if update_wind_direction(new_wind_direction):
-                # Update this file's settings in our persistent dictionary
-                if current_file:
-                    if current_file not in st.session_state.file_wind_settings:
-                        st.session_state.file_wind_settings[current_file] = {}
-                    st.session_state.file_wind_settings[current_file]['wind_direction'] = new_wind_direction
-                
-                st.success(f"Wind direction updated to {new_wind_direction}°")
-                st.rerun()  # Force UI refresh with new angles
-        
-        # Show the wind direction adjustment UI
-        user_wind_direction = wind_direction_selector(
-            current_wind=current_wind,
-            estimated_wind=estimated_wind,
-            on_change_callback=on_wind_change
-        )
+        # Show the wind direction adjustment UI (reruns on its own until applied)
+        _wind_direction_panel(current_wind, estimated_wind, current_file)
     
     # Process new file upload - but only if user has confirmed with Analyze button
     if uploaded_file is not None and st.session_state.get('analyze_confirmed', False) and uploaded_file.name == st.session_state.get('process_this_file'):
@@ -403,7 +734,10 @@ def display_page():
                 progress_text.markdown("🔍 **Stage 1/5:** Reading GPX file...")
                 progress_bar.progress(10)
                 
-                gpx_result = load_gpx_file(uploaded_file)
+                # Read the upload buffer once; its digest keys every cached step below
+                file_bytes = uploaded_file.getvalue()
+                track_key = _track_key(file_bytes)
+                gpx_result = _load_gpx_bytes(track_key, uploaded_file.name, file_bytes)
                 
                 # Handle both old and new return formats
                 if isinstance(gpx_result, tuple):
@@ -418,6 +752,7 @@ def display_page():
                 
                 # Store in session state
                 st.session_state.track_data = gpx_data
+                st.session_state.track_key = track_key
                 st.session_state.track_name = track_name
                 
                 progress_bar.progress(50)
@@ -426,21 +761,14 @@ def display_page():
                 logger.info(f"Loaded GPX file with {len(gpx_data)} points")
                 
                 # Calculate basic track metrics
-                metrics = calculate_track_metrics(gpx_data, min_speed_knots=active_speed_threshold)
+                metrics = _cached_metrics(track_key, active_speed_threshold, gpx_data)
                 st.session_state.track_metrics = metrics
                 
-                # Create stretches
-                stretches = find_consistent_angle_stretches(
-                    gpx_data, angle_tolerance, min_duration, min_distance
+                # Create stretches, filtered by speed
+                stretches = _detect_stretches(
+                    track_key, segment_params.angle_tolerance, segment_params.min_duration,
+                    segment_params.min_distance, segment_params.min_speed, gpx_data
                 )
-                
-                # Filter stretches by speed
-                if not stretches.empty:
-                    logger.info(f"Filtering {len(stretches)} stretches by min_speed: {min_speed} knots")
-                    
-                    # Filter by speed in knots directly - stretches['speed'] is already in knots
-                    stretches = stretches[stretches['speed'] >= min_speed]
-                    logger.info(f"After filtering: {len(stretches)} stretches remain")
                     
                 # Store in session state if not empty
                 if not stretches.empty:
@@ -458,17 +786,13 @@ def display_page():
                         # Store the current file name for tracking
                         st.session_state.current_file_name = uploaded_file.name
                         
-                        # Use the new unified wind estimation API
-                        analyzed_stretches = analyze_wind_angles(stretches.copy(), user_provided_wind)
-                        
                         # Get wind estimate with confidence level
                         # Use the enhanced distance-weighted wind estimation algorithm
-                        min_segment_distance = DEFAULT_MIN_SEGMENT_DISTANCE
-                        wind_estimate = estimate_wind_direction_weighted(
-                            analyzed_stretches.copy(),
+                        wind_estimate = _estimate_wind(
+                            stretches,
                             user_provided_wind,
-                            suspicious_angle_threshold=suspicious_angle_threshold,
-                            min_segment_distance=min_segment_distance
+                            suspicious_angle_threshold,
+                            DEFAULT_MIN_SEGMENT_DISTANCE
                         )
                         
                         # If estimation succeeded, use our central update function
@@ -507,6 +831,7 @@ def display_page():
                 st.error(f"Error loading GPX file: {e}")
                 gpx_data = pd.DataFrame()
                 st.session_state.track_data = None
+                st.session_state.track_key = None
                 st.session_state.track_name = None
                 
             # Clear the progress elements when done
@@ -540,7 +865,9 @@ def display_page():
     if 'track_data' in st.session_state and st.session_state.track_data is not None:
         # Get current values from session state
         gpx_data = st.session_state.track_data
-        metrics = st.session_state.track_metrics if 'track_metrics' in st.session_state else None
+        # Metrics follow the active speed threshold slider (cached per threshold)
+        metrics = _cached_metrics(_current_track_key(), active_speed_threshold, gpx_data)
+        st.session_state.track_metrics = metrics
         track_name = st.session_state.track_name
         wind_direction = st.session_state.get('wind_direction', DEFAULT_WIND_DIRECTION)
         estimated_wind = st.session_state.get('estimated_wind')
@@ -549,59 +876,15 @@ def display_page():
         # Display track summary in a nice card-like container without header
         
         with st.container(border=True):
-            # Create a modern track summary layout
-            col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-            
-            with col1:
-                st.markdown(f"**🏄 {track_name}**")
-                date_value = metrics.get('date', 'Unknown') if metrics else 'Unknown'
-                st.markdown(f"📅 **Date:** {date_value}")
-                
-            with col2:
-                # Duration metrics
-                if metrics and 'duration' in metrics:
-                    total_duration_mins = metrics['duration'].total_seconds() / 60
-                    st.markdown("⏱️ **Duration**")
-                    
-                    if 'active_duration' in metrics:
-                        active_mins = metrics['active_duration'].total_seconds() / 60
-                        active_percent = (metrics['active_duration'].total_seconds() / metrics['total_duration_seconds']) * 100 if metrics['total_duration_seconds'] > 0 else 0
-                        st.markdown(f"<span class='card-metric' style='font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);'>{total_duration_mins:.0f} min</span><br/>" + 
-                                  f"<span style='font-size:0.85rem; color:var(--text-color, #666);'>Active: {active_mins:.0f} min ({active_percent:.0f}%)</span>", 
-                                  unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"<span class='card-metric' style='font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);'>{total_duration_mins:.0f} min</span>", 
-                                  unsafe_allow_html=True)
-            
-            with col3:
-                # Distance metrics
-                if metrics and 'distance' in metrics:
-                    st.markdown("📏 **Distance**")
-                    st.markdown(f"<span class='card-metric' style='font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);'>{metrics['distance']:.2f} km</span>", 
-                              unsafe_allow_html=True)
-                
-            with col4:
-                # Speed metrics
-                if metrics and 'weighted_avg_speed' in metrics:
-                    st.markdown("⚡ **Average Speed**")
-                    st.markdown(f"<span class='card-metric' style='font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);'>{metrics['weighted_avg_speed']:.1f} kn</span><br/>" + 
-                              f"<span style='font-size:0.85rem; color:var(--text-color, #666);'>Above {active_speed_threshold} knots</span>", 
-                              unsafe_allow_html=True)
-                    
-                    # Show comparison if different
-                    if 'overall_avg_speed' in metrics and abs(metrics['overall_avg_speed'] - metrics['weighted_avg_speed']) > 0.1:
-                        st.caption(f"Overall avg: {metrics['overall_avg_speed']:.1f} knots (with stops)")
-                elif metrics and 'avg_speed' in metrics:
-                    st.markdown("⚡ **Average Speed**")
-                    st.markdown(f"<span class='card-metric' style='font-size:1.5rem; font-weight:bold; color:var(--primary-color, #0068C9);'>{metrics['avg_speed']:.1f} kn</span>", 
-                              unsafe_allow_html=True)
+            # Whole summary rendered as one grid element rather than four column blocks
+            st.markdown(_track_summary_html(track_name, metrics), unsafe_allow_html=True)
         
         # Continue with the rest of the analysis if we have stretches
         if stretches is not None and not stretches.empty:
             # Process stretches for display
-            display_df = stretches.copy()
-            display_df['original_index'] = display_df.index
-            display_df = display_df.reset_index()
+            # reset_index already returns a new frame, so no explicit copy is needed
+            display_df = stretches.reset_index()
+            display_df['original_index'] = display_df['index']
             
             # Make sure we have the angle_to_wind column before checking if suspicious
             if 'angle_to_wind' in display_df.columns:
@@ -615,8 +898,8 @@ def display_page():
                     lambda x: calc_angle(x, wind_direction))
                 display_df['suspicious'] = display_df['angle_to_wind'] < suspicious_angle_threshold
             
-            # Rename columns for display
-            display_df = display_df.rename(columns={
+            # Rename columns for display (in place on the frame built above)
+            display_df.rename(inplace=True, columns={
                 'index': 'segment_id',
                 'bearing': 'heading (°)',
                 'angle_to_wind': 'angle off wind (°)',
@@ -626,10 +909,7 @@ def display_page():
             })
             
             # Format for display
-            for col in ['heading (°)', 'angle off wind (°)']:
-                display_df[col] = display_df[col].round(1)
-            display_df['distance (m)'] = display_df['distance (m)'].round(1)
-            display_df['speed (knots)'] = display_df['speed (knots)'].round(2)
+            display_df = display_df.round(DISPLAY_ROUNDING)
             
             # SEGMENT SELECTION BAR - Placed before the map
             st.markdown("### 🔍 Segment Selection")
@@ -638,9 +918,23 @@ def display_page():
             selected_segments, filter_states = segment_selection_bar(display_df, suspicious_angle_threshold)
             st.session_state.selected_segments = selected_segments
             
+            # Segments used by the analysis sections below (computed once)
+            if selected_segments and len(selected_segments) > 0:
+                selected_stretches = stretches.loc[stretches.index.isin(selected_segments)]
+            else:
+                selected_stretches = stretches
+            
             # Display the map
             st.subheader("Track Map")
-            display_track_map(gpx_data, stretches, wind_direction, estimated_wind)
+            from ui.components.visualization import display_track_map
+            # Rebuild the map only when the track, segments or wind actually change
+            map_key = (
+                _current_track_key(),
+                _frame_key(stretches),
+                wind_direction,
+                estimated_wind
+            )
+            display_track_map(gpx_data, stretches, wind_direction, estimated_wind, cache_key=map_key)
             
             # Reorganize for a more compact, dense layout with 2 columns for main content
             col1, col2 = st.columns([1, 1])
@@ -651,16 +945,13 @@ def display_page():
                 st.subheader("📊 Performance Analysis")
                 
                 # Get the filtered segments for analysis
-                if selected_segments and len(selected_segments) > 0:
-                    analysis_stretches = stretches.loc[stretches.index.isin(selected_segments)]
-                else:
-                    analysis_stretches = stretches
+                analysis_stretches = selected_stretches
                 
                 # Find the best angles and speeds
                 if not analysis_stretches.empty:
-                    # Split into upwind/downwind for analysis
+                    # Best segment per (upwind/downwind, tack), found with NumPy masks and argmax
+                    best_angles = _best_angle_segments(analysis_stretches)
                     upwind = analysis_stretches[analysis_stretches['angle_to_wind'] < 90]
-                    downwind = analysis_stretches[analysis_stretches['angle_to_wind'] >= 90]
                     
                     with st.container(border=True):
                         best_cols = st.columns(2)
@@ -669,23 +960,11 @@ def display_page():
                         with best_cols[0]:
                             st.markdown("#### 🔼 Best Upwind")
                             if not upwind.empty:
-                                # Split by tack
-                                port_upwind = upwind[upwind['tack'] == 'Port']
-                                starboard_upwind = upwind[upwind['tack'] == 'Starboard']
+                                best_port = best_angles.get(('up', 'Port'))
+                                best_starboard = best_angles.get(('up', 'Starboard'))
                                 
-                                # Find best port tack upwind angle - just use minimum angle
-                                if not port_upwind.empty and len(port_upwind) > 0:
-                                    best_port = port_upwind.loc[port_upwind['angle_to_wind'].idxmin()]
-                                    st.metric("Best Port Angle", f"{best_port['angle_to_wind']:.1f}°", 
-                                            f"{best_port['speed']:.1f} knots")
-                                    st.caption(f"Bearing: {best_port['bearing']:.0f}°")
-                                
-                                # Find best starboard tack upwind angle - just use minimum angle
-                                if not starboard_upwind.empty and len(starboard_upwind) > 0:
-                                    best_starboard = starboard_upwind.loc[starboard_upwind['angle_to_wind'].idxmin()]
-                                    st.metric("Best Starboard Angle", f"{best_starboard['angle_to_wind']:.1f}°", 
-                                            f"{best_starboard['speed']:.1f} knots")
-                                    st.caption(f"Bearing: {best_starboard['bearing']:.0f}°")
+                                # Best upwind angle on each tack - just use minimum angle
+                                _render_metric_rows(_best_angle_metric_rows(best_angles, 'up'))
                                 
                                 # Calculate VMG upwind using enhanced distance-weighted algorithm
                                 import math
@@ -701,12 +980,14 @@ def display_page():
                                     min_segment_distance=min_segment_distance
                                 )
                                 
-                                # Fallback to original single-best-angle approach if we have both tacks
-                                # but don't have sufficient weighted data
-                                if (upwind_vmg is None or upwind_vmg == 0) and 'best_port' in locals() and 'best_starboard' in locals():
+                                has_both_tacks = best_port is not None and best_starboard is not None
+                                if has_both_tacks:
                                     # Simply average the angles - no balancing or weighting
                                     pointing_power = (best_port['angle_to_wind'] + best_starboard['angle_to_wind']) / 2
-                                    
+                                
+                                # Fallback to original single-best-angle approach if we have both tacks
+                                # but don't have sufficient weighted data
+                                if (upwind_vmg is None or upwind_vmg == 0) and has_both_tacks:
                                     # Average speed
                                     avg_upwind_speed = (best_port['speed'] + best_starboard['speed']) / 2
                                     
@@ -721,13 +1002,9 @@ def display_page():
                                             help=f"Advanced distance-weighted VMG calculation using segments within {angle_range}° of best angle. Prioritizes longer segments (min {min_segment_distance}m) for more accurate representation of upwind performance.")
                                     
                                     # Display session average wind direction - simple average
-                                    if 'best_port' in locals() and 'best_starboard' in locals():
+                                    if has_both_tacks:
                                         # Note the angle difference but don't balance
                                         angle_diff = abs(best_port['angle_to_wind'] - best_starboard['angle_to_wind'])
-                                        
-                                        # Compute average angle if not already done
-                                        if 'pointing_power' not in locals():
-                                            pointing_power = (best_port['angle_to_wind'] + best_starboard['angle_to_wind']) / 2
                                             
                                         st.markdown("---")
                                         st.info(f"**Session Average Wind Direction**  \n"
@@ -739,25 +1016,10 @@ def display_page():
                         # DOWNWIND PERFORMANCE - Best angles/speeds
                         with best_cols[1]:
                             st.markdown("#### 🔽 Best Downwind")
-                            if not downwind.empty:
-                                # Split by tack
-                                port_downwind = downwind[downwind['tack'] == 'Port']
-                                starboard_downwind = downwind[downwind['tack'] == 'Starboard']
-                                
-                                # Find best port tack downwind angle
-                                if not port_downwind.empty:
-                                    # For downwind, we want the largest angle from wind
-                                    best_port = port_downwind.loc[port_downwind['angle_to_wind'].idxmax()]
-                                    st.metric("Best Port Angle", f"{best_port['angle_to_wind']:.1f}°",
-                                            f"{best_port['speed']:.1f} knots")
-                                    st.caption(f"Bearing: {best_port['bearing']:.0f}°")
-                                
-                                # Find best starboard tack downwind angle
-                                if not starboard_downwind.empty:
-                                    best_starboard = starboard_downwind.loc[starboard_downwind['angle_to_wind'].idxmax()]
-                                    st.metric("Best Starboard Angle", f"{best_starboard['angle_to_wind']:.1f}°",
-                                            f"{best_starboard['speed']:.1f} knots")
-                                    st.caption(f"Bearing: {best_starboard['bearing']:.0f}°")
+                            # For downwind, the best angle is the largest angle from wind
+                            downwind_rows = _best_angle_metric_rows(best_angles, 'down')
+                            if downwind_rows:
+                                _render_metric_rows(downwind_rows)
                             else:
                                 st.info("No downwind data")
             
@@ -767,15 +1029,10 @@ def display_page():
                 st.subheader("🎯 Sailing Performance")
                 
                 # Get the filtered stretches for visualization
-                if selected_segments and len(selected_segments) > 0:
-                    filtered_stretches = stretches.loc[stretches.index.isin(selected_segments)]
-                    source_note = f"(using {len(filtered_stretches)} selected segments)"
-                else:
-                    filtered_stretches = stretches
-                    source_note = f"(using all {len(stretches)} segments)"
+                filtered_stretches = selected_stretches
                 
                 if len(filtered_stretches) > 2:
-                    fig = plot_polar_diagram(filtered_stretches, wind_direction)
+                    fig = _cached_polar_diagram(_frame_key(filtered_stretches), wind_direction, filtered_stretches)
                     st.pyplot(fig)
                 else:
                     st.info("Not enough data for polar plot (need at least 3 segments)")
@@ -803,10 +1060,7 @@ def display_page():
                 segment_selection_checkboxes(display_df)
             
             # Add wind re-estimation button and average angles at the bottom after all tabs
-            if selected_segments and len(selected_segments) > 0:
-                filtered_stretches = stretches.loc[stretches.index.isin(selected_segments)]
-            else:
-                filtered_stretches = stretches
+            filtered_stretches = selected_stretches
             
             if len(filtered_stretches) > 0:
                 # Add wind re-estimation button
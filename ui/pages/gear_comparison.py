@@ -7,7 +7,6 @@ This module contains the UI for comparing gear performance.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 import math
@@ -1,38 +1,50 @@
 import pandas as pd
 import numpy as np
 from sklearn.cluster import KMeans
-from utils.calculations import calculate_bearing, calculate_distance, angle_to_wind
+from utils.geo import MPS_TO_KNOTS, calculate_bearings, calculate_distances
 
 def find_consistent_angle_stretches(df, angle_tolerance, min_duration_seconds, min_distance_meters):
     """Find stretches of consistent sailing angle."""
     if len(df) < 2:
         return pd.DataFrame()
     
-    # Calculate bearing and distance for each point
-    bearings = []
-    distances = []
-    durations = []
-    
-    for i in range(len(df) - 1):
-        lat1, lon1 = df.iloc[i]['latitude'], df.iloc[i]['longitude']
-        lat2, lon2 = df.iloc[i+1]['latitude'], df.iloc[i+1]['longitude']
-        
-        bearing = calculate_bearing(lat1, lon1, lat2, lon2)
-        distance = calculate_distance(lat1, lon1, lat2, lon2)
-        
-        bearings.append(bearing)
-        distances.append(distance)
-        
-        if i > 0 and 'time' in df.columns and df.iloc[i]['time'] is not None and df.iloc[i-1]['time'] is not None:
-            duration = (df.iloc[i]['time'] - df.iloc[i-1]['time']).total_seconds()
-            durations.append(duration)
+    # Bearing, distance and duration for each point, written into arrays sized to
+    # the track (the last hop is repeated so every point has a value)
+    n = len(df)
+    bearings = np.empty(n, dtype=np.float64)
+    distances = np.empty(n, dtype=np.float64)
+    durations = np.zeros(n, dtype=np.float64)
+    
+    # Bearings and distances between consecutive points, for the whole track at once
+    lats = df['latitude'].to_numpy(dtype=float)
+    lons = df['longitude'].to_numpy(dtype=float)
+    bearings[:-1] = calculate_bearings(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    distances[:-1] = calculate_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    bearings[-1] = bearings[-2]
+    distances[-1] = distances[-2]
+    
+    # Timestamps as datetime64 once; hop and stretch durations are differences of
+    # this array instead of Timedelta objects built row by row. A missing (None)
+    # time counts as zero duration, while NaT in a datetime column gives NaN.
+    times = None
+    if 'time' in df.columns:
+        time_column = df['time']
+        times = pd.to_datetime(time_column).to_numpy(dtype='datetime64[ns]')
+        if isinstance(time_column.dtype, pd.DatetimeTZDtype) or np.issubdtype(time_column.dtype, np.datetime64):
+            missing_time = np.zeros(n, dtype=bool)
         else:
-            durations.append(0)
+            missing_time = time_column.isna().to_numpy()
+    
+    def seconds_between(start_idx, end_idx):
+        if times is None or missing_time[start_idx] or missing_time[end_idx]:
+            return 0
+        return (times[end_idx] - times[start_idx]) / np.timedelta64(1, 's')
     
-    # Add one more to match length of dataframe
-    bearings.append(bearings[-1] if bearings else 0)
-    distances.append(distances[-1] if distances else 0)
-    durations.append(durations[-1] if durations else 0)
+    # Duration of the hop into each point (zero for the first)
+    if times is not None and n > 2:
+        durations[1:-1] = np.diff(times[:-1]) / np.timedelta64(1, 's')
+        durations[1:-1][missing_time[1:-1] | missing_time[:-2]] = 0
+        durations[-1] = durations[-2]
     
     df = df.copy()
     df['bearing'] = bearings
@@ -41,7 +53,7 @@ def find_consistent_angle_stretches(df, angle_tolerance, min_duration_seconds, m
     
     # Find stretches of consistent angle
     stretches = []
-    current_stretch = {'start_idx': 0, 'start_time': df.iloc[0]['time'], 'bearing': bearings[0]}
+    current_stretch = {'start_idx': 0, 'bearing': bearings[0]}
     
     for i in range(1, len(df)):
         angle_diff = min((df.iloc[i]['bearing'] - current_stretch['bearing']) % 360, 
@@ -53,10 +65,7 @@ def find_consistent_angle_stretches(df, angle_tolerance, min_duration_seconds, m
             if end_idx > current_stretch['start_idx']:
                 stretch_df = df.iloc[current_stretch['start_idx']:end_idx+1]
                 total_distance = stretch_df['distance_m'].sum()
-                if 'time' in df.columns and df.iloc[end_idx]['time'] is not None and current_stretch['start_time'] is not None:
-                    duration = (df.iloc[end_idx]['time'] - current_stretch['start_time']).total_seconds()
-                else:
-                    duration = 0
+                duration = seconds_between(current_stretch['start_idx'], end_idx)
                 
                 # Only add if meets BOTH minimum criteria
                 if duration >= min_duration_seconds and total_distance >= min_distance_meters:
@@ -70,14 +79,11 @@ def find_consistent_angle_stretches(df, angle_tolerance, min_duration_seconds, m
                     })
             
             # Start new stretch
-            current_stretch = {'start_idx': i, 'start_time': df.iloc[i]['time'], 'bearing': df.iloc[i]['bearing']}
+            current_stretch = {'start_idx': i, 'bearing': df.iloc[i]['bearing']}
     
     # Check if the last stretch meets criteria
     if len(df) > 0:
-        if 'time' in df.columns and df.iloc[-1]['time'] is not None and current_stretch['start_time'] is not None:
-            duration = (df.iloc[-1]['time'] - current_stretch['start_time']).total_seconds()
-        else:
-            duration = 0
+        duration = seconds_between(current_stretch['start_idx'], len(df) - 1)
         
         stretch_df = df.iloc[current_stretch['start_idx']:]
         total_distance = stretch_df['distance_m'].sum()
@@ -95,8 +101,8 @@ def find_consistent_angle_stretches(df, angle_tolerance, min_duration_seconds, m
             
     if stretches and len(stretches) > 0:
         result_df = pd.DataFrame(stretches)
-        # Convert speed from m/s to knots (1 m/s = 1.94384 knots)
-        result_df['speed'] = result_df['speed'] * 1.94384
+        # Convert speed from m/s to knots
+        result_df['speed'] = result_df['speed'] * MPS_TO_KNOTS
         
         # Log the found stretches for debugging
         import logging
@@ -119,25 +125,30 @@ def analyze_wind_angles(stretches, wind_direction):
     # Add the wind direction for reference
     result['wind_direction'] = wind_direction
     
-    # Calculate angles relative to wind
-    result['angle_to_wind'] = result['bearing'].apply(
-        lambda x: angle_to_wind(x, wind_direction))
+    # Angle to wind, tack and upwind/downwind all follow from one modular
+    # difference between the bearings and the wind direction
+    offset = (result['bearing'].to_numpy(dtype=float) - wind_direction) % 360
+    port = offset <= 180
+    angles = np.where(port, offset, 360 - offset)
+    upwind_downwind = np.where(angles < 90, 'Upwind', 'Downwind')
+    tack = np.where(port, 'Port', 'Starboard')
     
-    # Determine tack based on bearing relative to wind direction
-    result['tack'] = result['bearing'].apply(
-        lambda x: 'Port' if (x - wind_direction) % 360 <= 180 else 'Starboard')
+    import logging
+    logger = logging.getLogger(__name__)
+    
+    # Log suspicious values but don't modify them - let the user decide
+    for angle, bearing in zip(angles[angles < 15], result['bearing'].to_numpy()[angles < 15]):
+        logger.warning(f"Suspiciously small angle to wind detected: {angle}° " +
+                       f"(bearing: {bearing % 360}°, wind: {wind_direction % 360}°)")
     
-    # Determine upwind vs downwind based on angle to wind
-    result['upwind_downwind'] = result.apply(
-        lambda row: 'Upwind' if row['angle_to_wind'] < 90 else 'Downwind', axis=1)
+    result['angle_to_wind'] = angles
+    result['tack'] = tack
+    result['upwind_downwind'] = upwind_downwind
     
     # Create combined category for coloring and display
-    result['sailing_type'] = result.apply(
-        lambda row: f"{row['upwind_downwind']} {row['tack']}", axis=1)
+    result['sailing_type'] = np.char.add(np.char.add(upwind_downwind, ' '), tack)
     
     # Add debug info to help verify calculations
-    import logging
-    logger = logging.getLogger(__name__)
     logger.info(f"Wind direction: {wind_direction}°")
     
     # Log a summary of the tacks
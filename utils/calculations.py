@@ -1,7 +1,8 @@
 import math
 from datetime import timedelta
-from geopy.distance import geodesic
 import numpy as np
+import pandas as pd
+from utils.geo import MPS_TO_KNOTS, calculate_distance, calculate_distances
 
 def calculate_bearing(lat1, lon1, lat2, lon2):
     """Calculate the bearing between two points in degrees."""
@@ -22,10 +23,6 @@ def calculate_bearing(lat1, lon1, lat2, lon2):
     
     return compass_bearing
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two points in meters."""
-    return geodesic((lat1, lon1), (lat2, lon2)).meters
-
 def calculate_track_metrics(gpx_data, min_speed_knots=0.0):
     """
     Calculate basic metrics for the track.
@@ -53,66 +50,65 @@ def calculate_track_metrics(gpx_data, min_speed_knots=0.0):
     
     # Calculate total distance and speed for each segment
     if len(gpx_data) > 1:
-        distances = []
-        speeds_m_per_s = []
-        segment_durations = []
+        # Pull the columns out once; everything below works on these arrays
+        lats = gpx_data['latitude'].to_numpy(dtype=float)
+        lons = gpx_data['longitude'].to_numpy(dtype=float)
+        times = (
+            pd.to_datetime(gpx_data['time']).to_numpy(dtype='datetime64[ns]')
+            if 'time' in gpx_data.columns else None
+        )
         
-        for i in range(len(gpx_data) - 1):
-            point1 = (gpx_data.iloc[i]['latitude'], gpx_data.iloc[i]['longitude'])
-            point2 = (gpx_data.iloc[i+1]['latitude'], gpx_data.iloc[i+1]['longitude'])
-            
-            # Calculate distance for this segment
-            segment_distance_km = geodesic(point1, point2).kilometers
-            segment_distance_m = segment_distance_km * 1000
-            distances.append(segment_distance_m)
-            
-            # Calculate duration and speed if time data available
-            if 'time' in gpx_data.columns and gpx_data.iloc[i]['time'] is not None and gpx_data.iloc[i+1]['time'] is not None:
-                segment_duration = (gpx_data.iloc[i+1]['time'] - gpx_data.iloc[i]['time']).total_seconds()
-                segment_durations.append(segment_duration)
-                
-                # Calculate speed in m/s
-                if segment_duration > 0:
-                    speed_m_per_s = segment_distance_m / segment_duration
-                    speeds_m_per_s.append(speed_m_per_s)
+        # Distances between consecutive points, computed for the whole track at once
+        distances = calculate_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        
+        # Hop durations in seconds; hops touching a missing timestamp are NaN
+        if times is not None:
+            segment_durations = (times[1:] - times[:-1]) / np.timedelta64(1, 's')
+        else:
+            segment_durations = np.full(len(distances), np.nan)
+        
+        # Speed in m/s for hops that take time, keeping durations aligned with speeds
+        moving = segment_durations > 0
+        segment_durations = segment_durations[moving]
+        speeds_m_per_s = distances[moving] / segment_durations
         
         # Total distance in kilometers
-        total_distance_km = sum(distances) / 1000
+        total_distance_km = float(distances.sum()) / 1000
         metrics['distance'] = total_distance_km
         
         # Calculate average speed excluding segments below threshold
-        if speeds_m_per_s:
+        if speeds_m_per_s.size:
             # Convert speeds to knots for comparison with threshold
-            speeds_knots = [s * 1.94384 for s in speeds_m_per_s]
+            speeds_knots = speeds_m_per_s * MPS_TO_KNOTS
             
             # Filter by minimum speed
-            min_speed_ms = min_speed_knots / 1.94384
-            active_speeds_ms = [s for s, knots in zip(speeds_m_per_s, speeds_knots) if knots >= min_speed_knots]
-            active_durations = [d for d, knots in zip(segment_durations, speeds_knots) if knots >= min_speed_knots]
+            active = speeds_knots >= min_speed_knots
+            active_speeds_ms = speeds_m_per_s[active]
+            active_durations = segment_durations[active]
             
-            if active_speeds_ms:
+            if active_speeds_ms.size:
                 # Calculate distance covered at speeds above threshold
-                active_distance_m = sum(s * d for s, d in zip(active_speeds_ms, active_durations))
-                active_time_s = sum(active_durations)
+                active_distance_m = float(np.dot(active_speeds_ms, active_durations))
+                active_time_s = float(active_durations.sum())
                 
                 # Calculate metrics
                 metrics['active_duration'] = timedelta(seconds=active_time_s)
                 metrics['active_distance'] = active_distance_m / 1000  # in km
                 
                 # Calculate average speed from segments above threshold
-                avg_speed_ms = sum(active_speeds_ms) / len(active_speeds_ms)
-                metrics['avg_speed'] = avg_speed_ms * 1.94384  # Convert to knots
+                avg_speed_ms = float(active_speeds_ms.mean())
+                metrics['avg_speed'] = avg_speed_ms * MPS_TO_KNOTS  # Convert to knots
                 
                 # Calculate weighted average speed (by duration)
                 if active_time_s > 0:
                     weighted_avg_ms = active_distance_m / active_time_s
-                    metrics['weighted_avg_speed'] = weighted_avg_ms * 1.94384
+                    metrics['weighted_avg_speed'] = weighted_avg_ms * MPS_TO_KNOTS
                 else:
                     metrics['weighted_avg_speed'] = 0
                 
                 # Calculate "traditional" avg speed over whole track for comparison
                 m_per_s = total_distance_km * 1000 / metrics['total_duration_seconds'] if metrics['total_duration_seconds'] > 0 else 0
-                metrics['overall_avg_speed'] = m_per_s * 1.94384
+                metrics['overall_avg_speed'] = m_per_s * MPS_TO_KNOTS
             else:
                 # If there are no segments above the threshold
                 metrics['active_duration'] = timedelta(seconds=0)
@@ -136,7 +132,7 @@ def calculate_track_metrics(gpx_data, min_speed_knots=0.0):
 
 def meters_per_second_to_knots(speed_ms):
     """Convert meters per second to knots."""
-    return speed_ms * 1.94384
+    return speed_ms * MPS_TO_KNOTS
 
 def angle_to_wind(bearing, wind_direction):
     """
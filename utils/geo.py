@@ -5,9 +5,20 @@ This module contains functions for calculating distances, bearings,
 and other geographic utilities.
 """
 
+import logging
 import math
 from typing import Tuple, Union, List
-from geopy.distance import geodesic
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# WGS-84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+# Knots per meter per second
+MPS_TO_KNOTS = 1.94384
 
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -43,6 +54,10 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     """
     Calculate distance between two points in meters.
     
+    Scalar form of calculate_distances (Vincenty on WGS-84). Nearly antipodal
+    points may not converge; a warning is logged and the distance can be off
+    by kilometres.
+    
     Args:
         lat1: Latitude of first point in degrees
         lon1: Longitude of first point in degrees
@@ -52,7 +67,176 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         float: Distance in meters
     """
-    return geodesic((lat1, lon1), (lat2, lon2)).meters
+    return float(calculate_distances(lat1, lon1, lat2, lon2))
+
+def calculate_bearings(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized version of calculate_bearing for arrays of point pairs.
+    
+    Args:
+        lat1: Latitudes of the first points in degrees
+        lon1: Longitudes of the first points in degrees
+        lat2: Latitudes of the second points in degrees
+        lon2: Longitudes of the second points in degrees
+        
+    Returns:
+        np.ndarray: Bearings in degrees (0-359)
+    """
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlon = np.radians(lon2) - np.radians(lon1)
+    
+    x = np.sin(dlon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+def calculate_distances(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray,
+    max_iterations: int = 200, tolerance: float = 1e-12
+) -> np.ndarray:
+    """
+    Vectorized ellipsoidal distance between arrays of point pairs.
+    
+    Uses Vincenty's inverse formula on the WGS-84 ellipsoid, which agrees with
+    geopy's geodesic to well below a millimetre for the short hops between
+    consecutive GPS fixes, but runs as a handful of NumPy operations instead
+    of one Python call per pair. Scalars are accepted as well. The iteration
+    may not converge for nearly antipodal points, which never occur between
+    consecutive track points; a warning is logged when it does not.
+    
+    Args:
+        lat1: Latitudes of the first points in degrees
+        lon1: Longitudes of the first points in degrees
+        lat2: Latitudes of the second points in degrees
+        lon2: Longitudes of the second points in degrees
+        max_iterations: Maximum number of iterations for the longitude difference
+        tolerance: Convergence threshold for the longitude difference in radians
+        
+    Returns:
+        np.ndarray: Distances in meters
+    """
+    L = np.radians(np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float))
+    sin_u1, cos_u1 = _reduced_latitude(lat1)
+    sin_u2, cos_u2 = _reduced_latitude(lat2)
+    return _vincenty(L, sin_u1, cos_u1, sin_u2, cos_u2, max_iterations, tolerance)
+
+def calculate_track_hops(
+    lats: np.ndarray, lons: np.ndarray,
+    max_iterations: int = 200, tolerance: float = 1e-12
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bearing and distance of every hop between consecutive track points.
+    
+    Same results as calculate_bearings and calculate_distances on
+    (lats[:-1], lons[:-1], lats[1:], lons[1:]), but every point is shared by
+    two hops, so the per-point radians and trigonometry are computed once
+    rather than once per hop end.
+    
+    Args:
+        lats: Latitudes of the track points in degrees
+        lons: Longitudes of the track points in degrees
+        max_iterations: Maximum number of iterations for the longitude difference
+        tolerance: Convergence threshold for the longitude difference in radians
+        
+    Returns:
+        tuple: (bearings in degrees (0-359), distances in meters), one per hop
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    
+    lat = np.radians(lats)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    dlon = np.diff(np.radians(lons))
+    
+    x = np.sin(dlon) * cos_lat[1:]
+    y = cos_lat[:-1] * sin_lat[1:] - sin_lat[:-1] * cos_lat[1:] * np.cos(dlon)
+    bearings = (np.degrees(np.arctan2(x, y)) + 360) % 360
+    
+    sin_u, cos_u = _reduced_latitude(lats)
+    distances = _vincenty(
+        np.radians(np.diff(lons)), sin_u[:-1], cos_u[:-1], sin_u[1:], cos_u[1:], max_iterations, tolerance
+    )
+    return bearings, distances
+
+def _reduced_latitude(lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sine and cosine of the WGS-84 reduced latitude.
+    
+    Args:
+        lat: Latitudes in degrees
+        
+    Returns:
+        tuple: (sin, cos) of the reduced latitudes
+    """
+    U = np.arctan((1 - WGS84_F) * np.tan(np.radians(lat)))
+    return np.sin(U), np.cos(U)
+
+def _vincenty(
+    L: np.ndarray,
+    sin_u1: np.ndarray, cos_u1: np.ndarray,
+    sin_u2: np.ndarray, cos_u2: np.ndarray,
+    max_iterations: int, tolerance: float
+) -> np.ndarray:
+    """
+    Vincenty's inverse formula from the longitude differences and reduced latitudes.
+    
+    Args:
+        L: Longitude differences in radians
+        sin_u1: Sine of the reduced latitudes of the first points
+        cos_u1: Cosine of the reduced latitudes of the first points
+        sin_u2: Sine of the reduced latitudes of the second points
+        cos_u2: Cosine of the reduced latitudes of the second points
+        max_iterations: Maximum number of iterations for the longitude difference
+        tolerance: Convergence threshold for the longitude difference in radians
+        
+    Returns:
+        np.ndarray: Distances in meters
+    """
+    f = WGS84_F
+    
+    lam = L
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            
+            # Coincident points have sin_sigma == 0 and a distance of zero
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            # Equatorial lines have cos2_alpha == 0
+            cos_2sigma_m = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_prev = lam
+            lam = L + (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+            )
+            
+            if not np.any(np.abs(lam - lam_prev) > tolerance):
+                break
+        else:
+            logger.warning(
+                "Vincenty distance did not converge for %d of %d point pairs (nearly antipodal "
+                "points); those distances may be off by kilometres",
+                np.count_nonzero(np.abs(lam - lam_prev) > tolerance), np.size(lam)
+            )
+    
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (
+        cos_2sigma_m + B / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+            - B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+        )
+    )
+    
+    return WGS84_B * A * (sigma - delta_sigma)
 
 def angle_to_wind(bearing: float, wind_direction: float) -> float:
     """
@@ -105,7 +289,7 @@ def meters_per_second_to_knots(speed_ms: float) -> float:
     Returns:
         float: Speed in knots
     """
-    return speed_ms * 1.94384
+    return speed_ms * MPS_TO_KNOTS
 
 def knots_to_meters_per_second(speed_knots: float) -> float:
     """
@@ -117,4 +301,4 @@ def knots_to_meters_per_second(speed_knots: float) -> float:
     Returns:
         float: Speed in meters per second
     """
-    return speed_knots / 1.94384
\ No newline at end of file
+    return speed_knots / MPS_TO_KNOTS
\ No newline at end of file
@@ -1,4 +1,3 @@
-import gpxpy
 import pandas as pd
 import os
 
@@ -8,6 +7,8 @@ def load_gpx_file(gpx_file):
     Returns:
         tuple: (DataFrame with track data, dict with metadata)
     """
+    import gpxpy
+    
     gpx = gpxpy.parse(gpx_file)
     
     # Extract metadata
@@ -52,7 +53,7 @@ def load_gpx_from_path(file_path):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"GPX file not found: {file_path}")
         
-    with open(file_path, 'r') as f:
+    with open(file_path, 'rb') as f:
         data, metadata = load_gpx_file(f)
         
         # Use filename if no name was extracted